@@ -20,37 +20,66 @@ and maintains proper formatting for issues, comments, and descriptions.
 
 Requirements:
     pip install requests markdown jira
+
+Optional:
+    pip install orjson  # faster (de)serialization of API JSON
 """
 
 # Standard library imports
 import argparse
-import html
 import http
 import json
 import logging
 import os
 import re
+import threading
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Third-party imports
 import markdown
 import requests
 
+from markdown.extensions.def_list import DefListExtension
+from markdown.extensions.fenced_code import FencedCodeExtension
+from markdown.extensions.nl2br import Nl2BrExtension
+from markdown.extensions.tables import TableExtension
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Local imports
 from jira_constants import Components, Categories, IssueTypes, Priorities, CustomFields
 
-# List of markdown extensions used for conversion
+# List of markdown extensions used for conversion; the classes are referenced
+# directly so building a parser needs no lookup by name. Each parser gets its
+# own instances since extensions may keep per-parser state. The toc extension
+# is not used: it only adds header ids, which Jira markup discards.
 MARKDOWN_EXTENSIONS = [
-    'markdown.extensions.def_list',
-    'markdown.extensions.fenced_code',
-    'markdown.extensions.nl2br',
-    'markdown.extensions.tables',
-    'markdown.extensions.toc',
+    DefListExtension,
+    FencedCodeExtension,
+    Nl2BrExtension,
+    TableExtension,
 ]
 
+# Number of pooled HTTP connections kept alive to the Jira host
+HTTP_POOL_SIZE = 32
+
+# Maximum number of files published concurrently
+MAX_WORKERS = 8
+
+# Maximum number of issues Jira accepts per bulk create request
+BULK_CREATE_SIZE = 50
+
 # patterns to match the estimated time frame with their extraction functions
 ESTIMATED_TIME_FRAME_PATTERNS = [
     {
@@ -63,6 +92,30 @@ ESTIMATED_TIME_FRAME_PATTERNS = [
     },
 ]
 
+# Precompiled patterns for the Jira markup post-processing
+_STRIKE_RE = re.compile(r'~~(.*?)~~')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_JIRA_HEADER_PREFIXES = frozenset({'h1.', 'h2.', 'h3.', 'h4.', 'h5.', 'h6.'})
+
+# Reason phrases by status code, so logging does not construct enum members
+_STATUS_PHRASES = {status.value: status.phrase for status in http.HTTPStatus}
+
+# Status codes that typically don't return content
+_NO_CONTENT_CODES = frozenset({
+    http.HTTPStatus.NO_CONTENT.value,  # 204
+    http.HTTPStatus.RESET_CONTENT.value,  # 205
+})
+
+# Seconds per time estimate unit
+_TIME_UNITS = {
+    'w': 7 * 24 * 60 * 60,  # weeks to seconds
+    'd': 24 * 60 * 60,      # days to seconds
+    'h': 60 * 60,           # hours to seconds
+    'm': 60,                # minutes to seconds
+    's': 1                  # seconds
+}
+
 def setup_logging(level: str = "INFO") -> None:
     """Setup logging configuration with { style formatting"""
     logging.basicConfig(
@@ -106,6 +159,278 @@ class CommandLine:
             as_comment=args.as_comment
         )
 
+def _json_body(data: Dict) -> bytes:
+    """
+    Serialize a request payload to compact UTF-8 JSON
+
+    Non-ASCII text is sent as-is instead of as \\uXXXX escapes, and orjson is
+    used when it is installed.
+
+    Args:
+        data: Request payload
+
+    Returns:
+        Encoded JSON body
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _json_loads(content: bytes):
+    """
+    Parse a UTF-8 JSON response body, using orjson when it is installed
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+class _JiraHTMLParser(HTMLParser):
+    """
+    Event-based HTML to Jira markup converter
+
+    The HTML produced by the markdown library is tokenized once; every element
+    that needs wrapping (headers, emphasis, links, list items, table cells, ...)
+    opens a frame on a stack that collects its converted content, and closing
+    the element pops the frame and writes the Jira markup to its parent.
+    """
+
+    # Inline tags and the Jira markers wrapped around their content
+    INLINE_MARKERS = {
+        'strong': '*', 'b': '*',
+        'em': '_', 'i': '_',
+        'del': '-', 's': '-',
+    }
+
+    # Elements whose whitespace-only text between children is insignificant
+    STRUCTURAL_TAGS = frozenset({'ul', 'ol', 'table', 'tr', 'dl'})
+
+    HEADER_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+    # Tags that open a frame on the stack
+    FRAME_TAGS = HEADER_TAGS | frozenset(INLINE_MARKERS) | frozenset({
+        'p', 'a', 'code', 'pre', 'li', 'ul', 'ol', 'table', 'tr', 'th', 'td',
+        'blockquote', 'dl', 'dt', 'dd',
+    })
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._out: List[str] = []
+        self._stack: List[list] = []
+        self._pre_depth = 0
+        self._after_br = False
+
+    def convert(self, html_content: str) -> str:
+        """Feed the HTML content and return the converted Jira markup"""
+        self.feed(html_content)
+        self.close()
+        # Close anything left open by malformed input
+        while self._stack:
+            self._close_frame(self._stack[-1][0])
+        return ''.join(self._out)
+
+    def _write(self, text: str) -> None:
+        """Append converted text to the innermost open frame"""
+        if self._stack:
+            self._stack[-1][2].append(text)
+        else:
+            self._out.append(text)
+
+    def _enclosing(self, *tags: str) -> Optional[list]:
+        """Return the innermost open frame with one of the given tags"""
+        for frame in reversed(self._stack):
+            if frame[0] in tags:
+                return frame
+        return None
+
+    def _list_markers(self) -> str:
+        """Jira list markers for the current nesting (e.g. '*', '##', '#*')"""
+        return ''.join('#' if frame[0] == 'ol' else '*'
+                       for frame in self._stack if frame[0] in ('ul', 'ol'))
+
+    def _flush_list_item(self, attrs: Dict, chunks: List[str]) -> None:
+        """Write the text collected so far for a list item as its own line"""
+        text = ''.join(chunks).strip()
+        chunks.clear()
+        if text and attrs['lines'] is not None:
+            attrs['lines'].append(f'{attrs["markers"]} {text}')
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self._after_br = tag == 'br'
+        if tag == 'br':
+            self._write('\n')
+            return
+        if tag == 'hr':
+            self._write('\n----\n\n')
+            return
+        if tag not in self.FRAME_TAGS:
+            return
+        if self._pre_depth and tag != 'pre':
+            # Everything inside <pre> is literal code; only note its language
+            if tag == 'code':
+                for css_class in (attrs.get('class') or '').split():
+                    if css_class.startswith('language-'):
+                        self._enclosing('pre')[1]['language'] = css_class[len('language-'):]
+            return
+
+        if tag == 'pre':
+            self._pre_depth += 1
+        elif tag in ('ul', 'ol'):
+            item = self._enclosing('li')
+            if item is not None:
+                # A nested list ends the parent item's own line
+                self._flush_list_item(item[1], item[2])
+            attrs['lines'] = []
+        elif tag == 'li':
+            attrs['markers'] = self._list_markers()
+            # Items of nested lists all land in the outermost list's lines
+            outermost = next((frame for frame in self._stack if frame[0] in ('ul', 'ol')), None)
+            attrs['lines'] = outermost[1]['lines'] if outermost is not None else None
+        elif tag == 'tr':
+            attrs['cells'] = []
+        elif tag == 'table':
+            attrs['rows'] = []
+
+        self._stack.append([tag, attrs, []])
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in ('br', 'hr'):
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        self._after_br = False
+        if tag not in self.FRAME_TAGS or self._enclosing(tag) is None:
+            return
+        if self._pre_depth and tag != 'pre':
+            # Tags inside <pre>, including its <code>, are part of the code block
+            return
+        # Close frames left open by mismatched markup
+        while self._stack[-1][0] != tag:
+            self._close_frame(self._stack[-1][0])
+        self._close_frame(tag)
+
+    def handle_data(self, data):
+        if self._after_br and data.startswith('\n'):
+            # nl2br emits '<br />\n'; the break already ends the line
+            data = data[1:]
+        self._after_br = False
+        if self._pre_depth:
+            self._write(data)
+        elif not (self._stack and self._stack[-1][0] in self.STRUCTURAL_TAGS and data.isspace()):
+            self._write(data)
+
+    def _close_frame(self, tag: str) -> None:
+        """Pop the innermost frame and write its Jira markup to the parent"""
+        _, attrs, chunks = self._stack.pop()
+        text = ''.join(chunks)
+        handler = self.CLOSE_HANDLERS.get(tag)
+        if handler is None:
+            self._write(text)
+        else:
+            handler(self, tag, attrs, chunks, text)
+
+    def _close_inline(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        # Jira markers must hug the text, so keep surrounding whitespace outside
+        marker = self.INLINE_MARKERS[tag]
+        core = text.strip()
+        if core:
+            start = text.index(core)
+            text = f'{text[:start]}{marker}{core}{marker}{text[start + len(core):]}'
+        self._write(text)
+
+    def _close_code(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        # Jira monospace cannot span lines
+        self._write(text if '\n' in text else f'{{{{{text}}}}}')
+
+    def _close_link(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        href = attrs.get('href')
+        self._write(f'[{text}|{href}]' if href else text)
+
+    def _close_header(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        self._write(f'\n{tag}. {text.strip()}\n\n')
+
+    def _close_paragraph(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        self._write(text + ('\n' if self._enclosing('li') else '\n\n'))
+
+    def _close_pre(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        self._pre_depth -= 1
+        self._write(f'{self._code_macro(attrs)}\n{text.strip()}\n{{code}}\n\n')
+
+    def _close_list_item(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        self._flush_list_item(attrs, chunks)
+
+    def _close_list(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        if not self._enclosing('ul', 'ol'):
+            # Nested lists share the outermost list's lines
+            self._write('\n'.join(attrs['lines']) + '\n\n')
+
+    def _close_cell(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        row = self._enclosing('tr')
+        if row is not None:
+            row[1]['cells'].append((tag == 'th', text.strip() or ' '))
+
+    def _close_row(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        table = self._enclosing('table')
+        if table is not None and attrs['cells']:
+            separators = ['||' if header else '|' for header, _ in attrs['cells']]
+            row = ''.join(sep + cell for sep, (_, cell) in zip(separators, attrs['cells']))
+            table[1]['rows'].append(row + separators[-1])
+
+    def _close_table(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        self._write('\n'.join(attrs['rows']) + '\n\n')
+
+    def _close_blockquote(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        text = _BLANK_LINES_RE.sub('\n\n', text.strip())
+        if self._enclosing('blockquote'):
+            # Jira quotes do not nest; only the outermost one is marked up
+            self._write(f'{text}\n\n')
+        elif '\n' in text:
+            self._write(f'{{quote}}\n{text}\n{{quote}}\n\n')
+        else:
+            self._write(f'bq. {text}\n\n')
+
+    def _close_definition(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        self._write(text.strip() + '\n')
+
+    def _close_definition_list(self, tag: str, attrs: Dict, chunks: List[str], text: str) -> None:
+        self._write(text + '\n')
+
+    # Closing handler for each frame tag, resolved once instead of walking an
+    # if/elif chain for every closed element
+    CLOSE_HANDLERS = {
+        **dict.fromkeys(INLINE_MARKERS, _close_inline),
+        **dict.fromkeys(HEADER_TAGS, _close_header),
+        'code': _close_code,
+        'a': _close_link,
+        'p': _close_paragraph,
+        'pre': _close_pre,
+        'li': _close_list_item,
+        'ul': _close_list,
+        'ol': _close_list,
+        'th': _close_cell,
+        'td': _close_cell,
+        'tr': _close_row,
+        'table': _close_table,
+        'blockquote': _close_blockquote,
+        'dt': _close_definition,
+        'dd': _close_definition,
+        'dl': _close_definition_list,
+    }
+
+    def _code_macro(self, attrs: Dict) -> str:
+        """Opening {code} macro, with the language of the block if known"""
+        language = attrs.get('language')
+        return f'{{code:{language}}}' if language else '{code}'
+
 class JiraMarkdownConverter:
     """Convert markdown to Jira markup and publish to Jira"""
 
@@ -125,40 +450,64 @@ class JiraMarkdownConverter:
         self.session.auth = (cmd.username, cmd.api_token)
         self.session.headers.update({
             'Accept': 'application/json',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
+        # Pool connections across requests and retry rate limiting and transient
+        # server errors (honouring Retry-After); POST is left out of the retried
+        # methods so issues are never created twice. Once retries run out the
+        # last response is returned, so callers still see Jira's error body
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'PUT']),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Markdown parsers are reused across files but are not thread-safe,
+        # so each worker thread keeps its own; reset() clears per-document state
+        self._local = threading.local()
 
-    def _handle_response(self, response) -> Dict:
+    def _handle_response(self, response, parse: bool = True) -> Dict:
         """
         Handle HTTP response and return appropriate data based on status code
 
         Args:
             response: requests.Response object
+            parse: Whether to decode the JSON body; callers that discard the
+                result pass False to skip it
 
         Returns:
             Dict containing response data or empty dict for no-content responses
         """
         response.raise_for_status()
-        response.encoding = 'utf-8'
         status_code = response.status_code
 
-        # Check status codes that typically don't return content
-        no_content_codes = [
-            http.HTTPStatus.NO_CONTENT,  # 204
-            http.HTTPStatus.RESET_CONTENT,  # 205
-        ]
+        if not parse:
+            return {}
 
-        if status_code in no_content_codes or not response.content:
-            # get our response phrase
-            response_phrase = http.HTTPStatus(status_code).phrase
-            self.logger.debug(f"Response {status_code} ({response_phrase}): No content to parse")
+        # Check status codes that typically don't return content
+        if status_code in _NO_CONTENT_CODES or not response.content:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                # get our response phrase
+                response_phrase = _STATUS_PHRASES.get(status_code, '')
+                self.logger.debug(f"Response {status_code} ({response_phrase}): No content to parse")
             return {}
 
         try:
-            return response.json()
+            return _json_loads(response.content)
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             self.logger.warning(f"Failed to parse JSON response: {e}")
-            self.logger.debug(f"Response content: {response.text}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                response.encoding = 'utf-8'
+                self.logger.debug(f"Response content: {response.text}")
             return {}
 
     def convert_markdown_to_jira(self, markdown_content: str) -> str:
@@ -172,10 +521,13 @@ class JiraMarkdownConverter:
             Jira markup string
         """
         # First convert markdown to HTML
-        html_content = markdown.markdown(
-            markdown_content,
-            extensions=MARKDOWN_EXTENSIONS
-        )
+        md = getattr(self._local, 'md', None)
+        if md is None:
+            md = self._local.md = markdown.Markdown(
+                extensions=[extension() for extension in MARKDOWN_EXTENSIONS],
+                output_format='html5'
+            )
+        html_content = md.reset().convert(markdown_content)
 
         # Convert HTML to Jira markup
         jira_markup = self._html_to_jira_markup(html_content, markdown_content)
@@ -197,192 +549,88 @@ class JiraMarkdownConverter:
         Returns:
             Jira markup string
         """
-        markup = html_content
-
-        # Headers (Jira uses h1. h2. h3. etc.)
-        markup = re.sub(r'<h1 id="([^"]+)">(.*?)</h1>', r'h1. \2', markup)
-        markup = re.sub(r'<h2 id="([^"]+)">(.*?)</h2>', r'h2. \2', markup)
-        markup = re.sub(r'<h3 id="([^"]+)">(.*?)</h3>', r'h3. \2', markup)
-        markup = re.sub(r'<h4 id="([^"]+)">(.*?)</h4>', r'h4. \2', markup)
-        markup = re.sub(r'<h5 id="([^"]+)">(.*?)</h5>', r'h5. \2', markup)
-        markup = re.sub(r'<h6 id="([^"]+)">(.*?)</h6>', r'h6. \2', markup)
-
-        # Bold and italic
-        markup = re.sub(r'<strong>(.*?)</strong>', r'*\1*', markup)
-        markup = re.sub(r'<em>(.*?)</em>', r'_\1_', markup)
-
-        # Strikethrough
-        markup = re.sub(r'<del>(.*?)</del>', r'-\1-', markup)
-        markup = re.sub(r'<s>(.*?)</s>', r'-\1-', markup)
-
-        # Code blocks
-        markup = re.sub(
-            r'<pre><code class="language-([\w\-]+)">(.*?)</code></pre>',
-            lambda m: f'{{code:{m.group(1)}}}\n{html.unescape(m.group(2)).strip()}\n{{code}}',
-            markup,
-            flags=re.DOTALL
-        )
-        markup = re.sub(
-            r'<pre><code>(.*?)</code></pre>',
-            lambda m: f'{{code}}\n{html.unescape(m.group(1)).strip()}\n{{code}}',
-            markup,
-            flags=re.DOTALL
-        )
-
-        # Inline code
-        markup = re.sub(r'<code>(.*?)</code>', r'{{\1}}', markup)
-
-        # Links
-        markup = re.sub(r'<a href="([^"]+)">(.*?)</a>', r'[\2|\1]', markup)
-
-        # Lists - Convert to Jira list format
-        # Handle unordered lists
-        markup = re.sub(r'<ul>(.*?)</ul>', lambda m: self._convert_list_items(m.group(1), '*'), markup, flags=re.DOTALL)
-        # Handle ordered lists
-        markup = re.sub(r'<ol>(.*?)</ol>', lambda m: self._convert_list_items(m.group(1), '#'), markup, flags=re.DOTALL)
-
-        # Tables - Convert to Jira table format
-        markup = re.sub(r'<table>(.*?)</table>', lambda m: self._convert_table(m.group(1)), markup, flags=re.DOTALL)
+        # Convert the HTML structure to Jira markup in a single parse
+        markup = _JiraHTMLParser().convert(html_content)
 
-        # Blockquotes
-        markup = re.sub(r'<blockquote>(.*?)</blockquote>', r'bq. \1', markup, flags=re.DOTALL)
-
-        # Paragraphs - just get the text content
-        markup = re.sub(r'<p>(.*?)</p>', r'\1', markup)
-
-        # Line breaks
-        markup = re.sub(r'<br/?>', r'\n', markup)
-
-        # Handle strikethrough in post-processing
-        markup = re.sub(r'~~(.*?)~~', r'-\1-', markup)
-
-        # Clean up any remaining HTML tags
-        markup = re.sub(r'<[^>]+>', '', markup)
+        # Handle strikethrough in post-processing; markdown normally turns
+        # ~~text~~ into <del> already, so only scan when markers are left
+        if '~~' in markup:
+            markup = _STRIKE_RE.sub(r'-\1-', markup)
 
         # Clean up extra whitespace
-        markup = re.sub(r'\n\s*\n\s*\n', '\n\n', markup)
+        markup = _BLANK_LINES_RE.sub('\n\n', markup)
         markup = markup.strip()
 
-        # Add proper spacing around headers
-        markup = self._add_header_spacing(markup)
+        # Add proper spacing around headers, then around bold sections; the
+        # lines are handed from one step to the next instead of joining the
+        # document and splitting it again in between. Line endings are already
+        # normalized to '\n' by markdown; splitlines() would also break on
+        # form feeds and Unicode separators in the text
+        lines = self._add_header_spacing(markup.split('\n'))
+        return self._add_bold_section_spacing(lines)
 
-        # Add proper spacing around bold sections
-        markup = self._add_bold_section_spacing(markup)
-
-        return markup
-
-    def _convert_list_items(
-        self,
-        list_content: str,
-        marker: str
-    ) -> str:
-        """Convert list items to Jira format"""
-        # Find all list items
-        items = re.findall(r'<li>(.*?)</li>', list_content, flags=re.DOTALL)
-        if not items:
-            return list_content
-
-        # Convert each item to Jira format
-        jira_items = []
-        for item in items:
-            # Clean up the item content
-            item = re.sub(r'<[^>]+>', '', item).strip()
-            jira_items.append(f'{marker} {item}')
-
-        return '\n'.join(jira_items)
-
-    def _convert_table(self, table_content: str) -> str:
-        """Convert HTML table to Jira table format"""
-        # Find table rows
-        rows = re.findall(r'<tr>(.*?)</tr>', table_content, flags=re.DOTALL)
-        if not rows:
-            return table_content
-
-        jira_rows = []
-        for row in rows:
-            # Find cells (th or td)
-            cells = re.findall(r'<(?:th|td)>(.*?)</(?:th|td)>', row, flags=re.DOTALL)
-            if cells:
-                # Clean up cell content
-                clean_cells = [re.sub(r'<[^>]+>', '', cell).strip() for cell in cells]
-                jira_rows.append('||' + '||'.join(clean_cells) + '||')
-
-        return '\n'.join(jira_rows)
-
-    def _add_header_spacing(self, markup: str) -> str:
+    def _add_header_spacing(self, lines: List[str]) -> List[str]:
         """
         Add proper spacing around headers in Jira markup
 
         Args:
-            markup: Jira markup content
+            lines: Lines of the Jira markup (already stripped of outer whitespace)
 
         Returns:
-            Jira markup with proper header spacing
+            Lines of the Jira markup with proper header spacing
         """
-        lines = markup.split('\n')
         result_lines = []
 
-        for i, line in enumerate(lines):
+        for line in lines:
             # Check if this line is a header (starts with h1., h2., etc.)
-            if re.match(r'^h[1-6]\.\s', line):
-                # If this is the first header (index 0), only add newline after
-                if i == 0:
-                    result_lines.append(line)
+            if line[:3] in _JIRA_HEADER_PREFIXES and line[3:4].isspace():
+                # Add a newline before the header unless it is the first line
+                # or already follows one, and always add one after it
+                if result_lines and result_lines[-1]:
                     result_lines.append('')
-                else:
-                    # For all other headers, add newline before and after
-                    result_lines.append('')
-                    result_lines.append(line)
-                    result_lines.append('')
-            else:
-                # Non-header lines are added as-is
+                result_lines.append(line)
+                result_lines.append('')
+            elif line or not result_lines or result_lines[-1]:
+                # Non-header lines are added as-is, without doubling up
+                # empty lines (never more than 2 consecutive newlines)
                 result_lines.append(line)
 
-        # Join lines back together
-        result = '\n'.join(result_lines)
-
-        # Clean up any excessive newlines (more than 2 consecutive)
-        result = re.sub(r'\n{3,}', '\n\n', result)
-
-        return result
+        return result_lines
 
-    def _add_bold_section_spacing(self, markup: str) -> str:
+    def _add_bold_section_spacing(self, lines: List[str]) -> str:
         """
         Add proper spacing around bold sections (*text:*) in Jira markup
 
         Args:
-            markup: Jira markup content
+            lines: Lines of the Jira markup
 
         Returns:
             Jira markup with proper bold section spacing
         """
-        lines = markup.split('\n')
         result_lines = []
-
-        for i, line in enumerate(lines):
-            # Check if this line is a bold section (starts with * and ends with :)
-            if re.match(r'^\*.*\*\s*$', line):
-                # Check if previous line is empty
-                previous_line_empty = (i == 0) or (lines[i-1].strip() == '')
-
-                if previous_line_empty:
-                    # Previous line is empty, just add the bold section and a newline after
-                    result_lines.append(line)
-                    result_lines.append('')
-                else:
-                    # Previous line has content, add newline before and after
-                    result_lines.append('')
-                    result_lines.append(line)
+        previous_line = ''
+
+        for line in lines:
+            # Check if this line is a bold section (starts and ends with *)
+            stripped = line.rstrip()
+            if line.startswith('*') and len(stripped) > 1 and stripped.endswith('*'):
+                # Add a newline before unless the previous line is empty
+                if previous_line.strip():
                     result_lines.append('')
+                # Always add the bold section and a newline after
+                result_lines.append(line)
+                result_lines.append('')
             else:
                 # Non-bold section lines are added as-is
                 result_lines.append(line)
+            previous_line = line
 
         # Join lines back together
         result = '\n'.join(result_lines)
 
         # Clean up any excessive newlines (more than 2 consecutive)
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        if '\n\n\n' in result:
+            result = _EXCESS_NEWLINES_RE.sub('\n\n', result)
 
         return result
 
@@ -399,36 +647,30 @@ class JiraMarkdownConverter:
         # Remove whitespace and convert to lowercase
         time_str = time_str.strip().lower()
 
-        # Pattern to match: number + unit (w, d, h, m, s)
-        pattern = r'^(\d+(?:\.\d+)?)\s*(w|d|h|m|s)$'
-        match = re.match(pattern, time_str)
+        # Split into number + unit (w, d, h, m, s)
+        unit = time_str[-1:]
+        number = time_str[:-1].rstrip()
+        whole, dot, fraction = number.partition('.')
 
-        if not match:
+        if (
+            unit not in _TIME_UNITS
+            or not whole.isdecimal()
+            or (dot and not fraction.isdecimal())
+        ):
             self.logger.warning(f"Invalid time format '{time_str}'. Use format like '2h', '1d', '30m', '1w'")
             return None
 
-        value = float(match.group(1))
-        unit = match.group(2)
-
         # Convert to seconds
-        conversions = {
-            'w': 7 * 24 * 60 * 60,  # weeks to seconds
-            'd': 24 * 60 * 60,      # days to seconds
-            'h': 60 * 60,           # hours to seconds
-            'm': 60,                # minutes to seconds
-            's': 1                  # seconds
-        }
-
-        return int(value * conversions[unit])
+        return int(float(number) * _TIME_UNITS[unit])
 
-    def create_issue(
+    def build_issue_data(
         self,
         summary: str,
         description: str,
         cmd: CommandLine
     ) -> Dict:
         """
-        Create a new issue in Jira
+        Build the request payload for creating a new issue
 
         Args:
             summary: Issue summary/title
@@ -436,10 +678,8 @@ class JiraMarkdownConverter:
             cmd: CommandLine object containing all configuration options
 
         Returns:
-            Response data from Jira API
+            Issue payload with its "fields" for the Jira API
         """
-        url = f"{self.base_url}/rest/api/2/issue"
-
         data = {
             "fields": {
                 "project": {"key": self.project_key},
@@ -458,27 +698,74 @@ class JiraMarkdownConverter:
         if cmd.parent_key:
             data["fields"]["parent"] = {"key": cmd.parent_key}
 
+        return data
+
+    def create_issue(
+        self,
+        summary: str,
+        description: str,
+        cmd: CommandLine
+    ) -> Dict:
+        """
+        Create a new issue in Jira
+
+        Args:
+            summary: Issue summary/title
+            description: Issue description in Jira markup
+            cmd: CommandLine object containing all configuration options
+
+        Returns:
+            Response data from Jira API
+        """
+        url = f"{self.base_url}/rest/api/2/issue"
+
+        data = self.build_issue_data(summary, description, cmd)
+
         # Debug: Log the data being sent
         self.logger.debug(f"Sending data to Jira API: URL={url}")
-        self.logger.debug(f"Request data: {json.dumps(data, indent=2)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Request data: {json.dumps(data, indent=2)}")
 
-        response = self.session.post(url, json=data)
+        response = self.session.post(url, data=_json_body(data))
         status_code = response.status_code
 
         if status_code != http.HTTPStatus.CREATED:
-            status_phrase = http.HTTPStatus(status_code).phrase
-            self.logger.debug(f"Response status: {status_code} ({status_phrase})")
-            self.logger.debug(f"Response headers: {dict(response.headers)}")
-            self.logger.debug(f"Response body: {response.text}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                status_phrase = _STATUS_PHRASES.get(status_code, '')
+                self.logger.debug(f"Response status: {status_code} ({status_phrase})")
+                self.logger.debug(f"Response headers: {dict(response.headers)}")
+                self.logger.debug(f"Response body: {response.text}")
             response.raise_for_status()
 
         return self._handle_response(response)
 
+    def create_issues_bulk(self, issue_updates: List[Dict]) -> Dict:
+        """
+        Create several issues in Jira with a single request
+
+        Args:
+            issue_updates: Issue payloads as built by build_issue_data
+                (at most BULK_CREATE_SIZE per request)
+
+        Returns:
+            Response data from Jira API with the created "issues" and any
+            "errors" (each referencing its "failedElementNumber")
+        """
+        url = f"{self.base_url}/rest/api/2/issue/bulk"
+
+        data = {"issueUpdates": issue_updates}
+
+        self.logger.debug(f"Creating {len(issue_updates)} issues: URL={url}")
+
+        response = self.session.post(url, data=_json_body(data))
+        return self._handle_response(response)
+
     def update_issue(
         self,
         issue_key: str,
         summary: Optional[str] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        parse: bool = True
     ) -> Dict:
         """
         Update an existing issue in Jira
@@ -487,9 +774,10 @@ class JiraMarkdownConverter:
             issue_key: Jira issue key (e.g., PROJ-123)
             summary: Optional new summary
             description: Optional new description
+            parse: Whether to decode the response body
 
         Returns:
-            Response data from Jira API
+            Response data from Jira API, or an empty dict if not parsed
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}"
 
@@ -499,13 +787,14 @@ class JiraMarkdownConverter:
         if description:
             data["fields"]["description"] = description
 
-        response = self.session.put(url, json=data)
-        return self._handle_response(response)
+        response = self.session.put(url, data=_json_body(data))
+        return self._handle_response(response, parse=parse)
 
     def add_comment(
         self,
         issue_key: str,
-        comment: str
+        comment: str,
+        parse: bool = True
     ) -> Dict:
         """
         Add a comment to an existing issue
@@ -513,16 +802,17 @@ class JiraMarkdownConverter:
         Args:
             issue_key: Jira issue key (e.g., PROJ-123)
             comment: Comment content in Jira markup
+            parse: Whether to decode the response body
 
         Returns:
-            Response data from Jira API
+            Response data from Jira API, or an empty dict if not parsed
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment"
 
         data = {"body": comment}
 
-        response = self.session.post(url, json=data)
-        return self._handle_response(response)
+        response = self.session.post(url, data=_json_body(data))
+        return self._handle_response(response, parse=parse)
 
     def update_time_estimate(
         self,
@@ -548,13 +838,14 @@ class JiraMarkdownConverter:
             }
         }
         self.logger.debug(f"Updating time estimate for {issue_key} to {seconds}s")
-        response = self.session.put(url, json=data)
+        response = self.session.put(url, data=_json_body(data))
         status_code = response.status_code
 
         if status_code != http.HTTPStatus.NO_CONTENT:
-            status_phrase = http.HTTPStatus(status_code).phrase
-            self.logger.debug(f"Failed to update time estimate. Status: {status_code} ({status_phrase})")
-            self.logger.debug(f"Response body: {response.text}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                status_phrase = _STATUS_PHRASES.get(status_code, '')
+                self.logger.debug(f"Failed to update time estimate. Status: {status_code} ({status_phrase})")
+                self.logger.debug(f"Response body: {response.text}")
         else:
             self.logger.info(f"Time estimate updated for {issue_key}")
 
@@ -568,12 +859,10 @@ class JiraMarkdownConverter:
         Returns:
             Issue summary string
         """
-        # Split the markdown file into lines
-        markdown_lines = markdown_content.split('\n')
-
         # Get the summary from the first line of the markdown file
         # removing the markdown header
-        issue_summary = markdown_lines[0].strip()
+        first_line, _, _ = markdown_content.partition('\n')
+        issue_summary = first_line.strip()
         issue_summary = issue_summary.replace('#', '').strip()
 
         return issue_summary
@@ -593,55 +882,63 @@ class JiraMarkdownConverter:
         Returns:
             Processed content without time estimate section
         """
-        # split the markdown file into lines
-        markdown_lines = markdown_content.split('\n')
-
-        # remove the first two lines of the markdown file
-        markdown_lines = markdown_lines[2:]
+        # skip the first two lines of the markdown file (title and blank line)
+        body_start = markdown_content.find('\n')
+        if body_start != -1:
+            body_start = markdown_content.find('\n', body_start + 1)
+        if body_start == -1:
+            return ''
+        body_start += 1
+
+        # most files have no time estimate, so look for the marker once
+        # instead of scanning every line
+        pos = markdown_content.find('Estimated Time Frame', body_start)
+        if pos == -1:
+            return markdown_content[body_start:]
+
+        # isolate the line containing the marker
+        line_start = markdown_content.rfind('\n', 0, pos) + 1
+        line_end = markdown_content.find('\n', pos)
+        if line_end == -1:
+            line_end = len(markdown_content)
+        line = markdown_content[line_start:line_end]
 
         # get the estimated time from the markdown file
-        for idx, l in enumerate(markdown_lines):
-            if 'Estimated Time Frame' in l:
-                for pattern_info in ESTIMATED_TIME_FRAME_PATTERNS:
-                    match = pattern_info['pattern'].search(l)
-                    if match:
-                        # get the maximum number of days
-                        days = pattern_info['extract'](match)
-                        estimated_time = f"{days}d"
-                        self.logger.info(f"Estimated time: {estimated_time}")
-
-                        # update the provided command line object with the estimated time
-                        cmd.time_estimate = estimated_time
-                        break
-                # Break out of the outer loop once we've found and processed the time estimate
+        for pattern_info in ESTIMATED_TIME_FRAME_PATTERNS:
+            match = pattern_info['pattern'].search(line)
+            if match:
+                # get the maximum number of days
+                days = pattern_info['extract'](match)
+                estimated_time = f"{days}d"
+                self.logger.info(f"Estimated time: {estimated_time}")
+
+                # update the provided command line object with the estimated time
+                cmd.time_estimate = estimated_time
                 break
 
-        # we will only contain the data before the estimated time frame
-        markdown_lines = markdown_lines[:idx]
-
-        # join the markdown lines back together
-        processed_content = '\n'.join(markdown_lines)
+        # we will only contain the data before the estimated time frame,
+        # without the newline that ends the last kept line
+        processed_content = markdown_content[body_start:max(body_start, line_start - 1)]
 
         return processed_content
 
-    def publish_markdown_file(
+    def prepare_markdown_file(
         self,
         file_path: str,
         cmd: CommandLine
-    ) -> Dict:
+    ) -> Tuple[str, str]:
         """
-        Convert and publish a markdown file to Jira
+        Read a markdown file and convert it for publishing to Jira
 
         Args:
             file_path: Path to the markdown file
-            cmd: CommandLine object containing all configuration options
+            cmd: CommandLine object to update with the file's time estimate
 
         Returns:
-            Response data from Jira API
+            Tuple of the issue summary and the content in Jira markup
         """
         # Read markdown file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
+        markdown_content = Path(file_path).read_text(encoding='utf-8')
 
         # Extract issue summary
         issue_summary = self._extract_issue_summary(markdown_content)
@@ -651,20 +948,36 @@ class JiraMarkdownConverter:
 
         # Convert markdown to Jira markup
         jira_content = self.convert_markdown_to_jira(processed_content)
-        jira_content_lines = jira_content.split('\n')
-        jira_content = '\n'.join(jira_content_lines)
 
         # Debug: Log what we're about to send
-        self.logger.debug(f"Issue summary: '{issue_summary}'")
-        self.logger.debug(f"Jira content length: {len(jira_content)} characters")
-        self.logger.debug(f"First 200 chars of content: {jira_content[:200]}...")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Issue summary: '{issue_summary}'")
+            self.logger.debug(f"Jira content length: {len(jira_content)} characters")
+            self.logger.debug(f"First 200 chars of content: {jira_content[:200]}...")
+
+        return issue_summary, jira_content
+
+    def publish_markdown_file(
+        self,
+        file_path: str,
+        cmd: CommandLine
+    ) -> Dict:
+        """
+        Convert and publish a markdown file to Jira
+
+        Args:
+            file_path: Path to the markdown file
+            cmd: CommandLine object containing all configuration options
 
-        #return 0
+        Returns:
+            Response data from Jira API (only parsed when creating an issue)
+        """
+        issue_summary, jira_content = self.prepare_markdown_file(file_path, cmd)
 
         if cmd.as_comment and cmd.issue_key:
             # Add as comment to existing issue
             self.logger.info(f"Adding comment to issue: {cmd.issue_key}")
-            result = self.add_comment(cmd.issue_key, jira_content)
+            result = self.add_comment(cmd.issue_key, jira_content, parse=False)
             self.logger.info(f"Comment added successfully to {cmd.issue_key}")
         elif cmd.issue_key:
             # Update existing issue
@@ -672,7 +985,8 @@ class JiraMarkdownConverter:
             result = self.update_issue(
                 cmd.issue_key,
                 summary=issue_summary,
-                description=jira_content
+                description=jira_content,
+                parse=False
             )
             self.logger.info(f"Issue updated successfully: {cmd.issue_key}")
             # If we have a time estimate, update it after creation
@@ -695,6 +1009,74 @@ class JiraMarkdownConverter:
             #    self.update_time_estimate(issue_key, cmd.time_estimate)
         return result
 
+def create_issues(
+    converter: JiraMarkdownConverter,
+    cmd: CommandLine,
+    file_paths: List[str]
+) -> None:
+    """
+    Convert markdown files and create one new Jira issue per file in bulk
+
+    Args:
+        converter: JiraMarkdownConverter used for conversion and publishing
+        cmd: CommandLine object containing all configuration options
+        file_paths: Paths of the markdown files to publish
+    """
+    logger = logging.getLogger(__name__)
+
+    # Convert files concurrently; each task gets its own copy of the command
+    # line since the time estimate is extracted per file
+    prepared = []
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(file_paths))) as executor:
+        futures = [
+            executor.submit(converter.prepare_markdown_file, file_path, replace(cmd))
+            for file_path in file_paths
+        ]
+        for file_path, future in zip(file_paths, futures):
+            try:
+                issue_summary, jira_content = future.result()
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {str(e)}")
+                continue
+            issue_data = converter.build_issue_data(issue_summary, jira_content, cmd)
+            prepared.append((file_path, issue_data))
+
+    if not prepared:
+        return
+
+    # Submit the issues in chunks accepted by the bulk endpoint, sending the
+    # chunks of large batches concurrently over the shared session
+    chunks = [
+        prepared[start:start + BULK_CREATE_SIZE]
+        for start in range(0, len(prepared), BULK_CREATE_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as executor:
+        futures = [
+            executor.submit(converter.create_issues_bulk, [issue_data for _, issue_data in chunk])
+            for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                for file_path, _ in chunk:
+                    logger.error(f"Error processing {file_path}: {str(e)}")
+                continue
+
+            # Created issues are returned in request order, skipping failed elements
+            errors = {error.get('failedElementNumber'): error for error in result.get('errors', [])}
+            issues = iter(result.get('issues', []))
+            for idx, (file_path, _) in enumerate(chunk):
+                if idx in errors:
+                    logger.error(f"Error processing {file_path}: {errors[idx].get('elementErrors')}")
+                    continue
+                issue = next(issues, None)
+                if issue is None:
+                    logger.error(f"Error processing {file_path}: no issue returned")
+                    continue
+                logger.info(f"Issue created successfully: {issue['key']}")
+                logger.info(f"Successfully processed: {file_path}")
+
 def main():
     """Main function to handle command line arguments and execute conversion"""
     parser = argparse.ArgumentParser(description='Convert markdown files to Jira issues')
@@ -724,14 +1106,28 @@ def main():
     # Initialize converter
     converter = JiraMarkdownConverter(cmd)
 
-    # Process each file
+    # Skip files that do not exist
+    file_paths = []
     for file_path in cmd.files:
         if not os.path.exists(file_path):
             logger.error("File not found: {file_path}", extra={'file_path': file_path})
             continue
+        file_paths.append(file_path)
+
+    if not file_paths:
+        return
+
+    if not cmd.issue_key:
+        # New issues are created in bulk rather than one request per file
+        create_issues(converter, cmd, file_paths)
+        return
 
+    # Every file updates or comments on the same issue, so publish them one at
+    # a time in file order; each file gets its own copy of the command line
+    # since the time estimate is extracted per file
+    for file_path in file_paths:
         try:
-            result = converter.publish_markdown_file(file_path, cmd)
+            result = converter.publish_markdown_file(file_path, replace(cmd))
             logger.info(f"Successfully processed: {file_path}")
         except Exception as e:
             logger.error(f"Error processing {file_path}: {str(e)}")
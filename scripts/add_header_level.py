@@ -5,10 +5,13 @@ Converts # to ##, ## to ###, etc.
 """
 
 import argparse
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
 
 # Constants
 SCRIPT_EXAMPLES = """
@@ -18,29 +21,57 @@ Examples:
   python add_header_level.py .
 """
 
-def add_header_level(content: str) -> str:
-    """Add one level to all headers in the content"""
-    # Pattern to match headers (1-6 # symbols at start of line)
-    header_pattern = r'^(#{1,6})\s+(.+)$'
+# Files are read, transformed and written concurrently
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-    def replace_header(match):
-        level = match.group(1)
-        text = match.group(2)
-        # Add one more # to the level
-        new_level = '#' + level
-        return f"{new_level} {text}"
+# Files at least this large are read through mmap
+MMAP_THRESHOLD = 64 * 1024
 
-    # Apply the replacement to each line
-    lines = content.split('\n')
-    new_lines = []
+# Markdown header lines: 1-6 # symbols, whitespace, then the header text
+_HEADER_RE = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
 
-    for line in lines:
-        if re.match(header_pattern, line):
-            new_lines.append(re.sub(header_pattern, replace_header, line))
-        else:
-            new_lines.append(line)
-
-    return '\n'.join(new_lines)
+def add_header_level(content: str) -> str:
+    """Add one level to all headers in the content"""
+    # Without a single '#' there are no headers, so skip the scan
+    if '#' not in content:
+        return content
+
+    # Add one more # to every header in a single pass over the document
+    return _HEADER_RE.sub(r'#\1 \2', content)
+
+def read_markdown_file(file_path: Path) -> str:
+    """Read a markdown file as UTF-8 without newline translation"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return f.read().decode('utf-8')
+        # Decode large files straight from the page cache instead of copying
+        # them into an intermediate bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+
+def process_file(file_path: Path) -> bool:
+    """Add one header level to a single markdown file in place, returning whether it changed"""
+    # Read the file
+    content = read_markdown_file(file_path)
+
+    # Add header level
+    new_content = add_header_level(content)
+
+    # Leave already processed files untouched
+    if new_content == content:
+        return False
+
+    # Write back to file
+    file_path.write_bytes(new_content.encode('utf-8'))
+    return True
+
+def find_markdown_files(directory: Path) -> List[Path]:
+    """List the markdown files directly inside a directory"""
+    # Filter directory entries by name before building any Path objects
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()]
 
 def process_directory(directory_path: str):
     """Process all markdown files in the given directory"""
@@ -51,7 +82,7 @@ def process_directory(directory_path: str):
         return
 
     # Find all markdown files
-    markdown_files = list(directory.glob("*.md"))
+    markdown_files = find_markdown_files(directory)
 
     if not markdown_files:
         print(f"No markdown files found in {directory_path}")
@@ -59,21 +90,21 @@ def process_directory(directory_path: str):
 
     print(f"Found {len(markdown_files)} markdown files to process:")
 
-    for file_path in markdown_files:
-        print(f"Processing: {file_path.name}")
-
-        # Read the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Add header level
-        new_content = add_header_level(content)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(process_file, file_path) for file_path in markdown_files]
 
-        # Write back to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        # Report progress in file order as the results come in; a file that
+        # fails is reported without stopping the others
+        for file_path, future in zip(markdown_files, futures):
+            print(f"Processing: {file_path.name}")
 
-        print(f"  ✓ Updated {file_path.name}")
+            try:
+                if future.result():
+                    print(f"  ✓ Updated {file_path.name}")
+                else:
+                    print(f"  - No changes needed for {file_path.name}")
+            except Exception as e:
+                print(f"  ✗ Error processing {file_path.name}: {e}")
 
     print(f"\nCompleted processing {len(markdown_files)} files.")
 
@@ -108,7 +139,7 @@ def main():
         print(f"📁 Processing directory: {args.directory}")
         # For dry run, we'll just show what files would be processed
         directory = Path(args.directory)
-        markdown_files = list(directory.glob("*.md"))
+        markdown_files = find_markdown_files(directory)
 
         if not markdown_files:
             print(f"❌ No markdown files found in {args.directory}")
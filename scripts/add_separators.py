@@ -3,9 +3,23 @@
 Script to add triple dash separators after every level 1 header in markdown files.
 """
 
-import re
 import argparse
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
+
+# Files are read, transformed and written concurrently
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files at least this large are read through mmap
+MMAP_THRESHOLD = 64 * 1024
+
+# Level 1 header lines (# followed by whitespace) not already followed by a
+# separator line
+_H1_RE = re.compile(r'^#[^\S\n].*$(?!\n[^\S\n]*---[^\S\n]*$)', re.MULTILINE)
 
 def add_separators_after_h1(markdown_content: str) -> str:
     """
@@ -17,22 +31,46 @@ def add_separators_after_h1(markdown_content: str) -> str:
     Returns:
         Markdown content with separators added
     """
-    lines = markdown_content.split('\n')
-    result_lines = []
-
-    for i, line in enumerate(lines):
-        result_lines.append(line)
-
-        # Check if this is a level 1 header (starts with # followed by space)
-        if re.match(r'^#\s+', line):
-            # Check the next line to see if a separator already exists
-            if i + 1 < len(lines) and lines[i+1].strip() == '---':
-                continue  # Separator already exists, do nothing
-            else:
-                # Add separator on the next line
-                result_lines.append('---')
-
-    return '\n'.join(result_lines)
+    # Without a single '#' there are no headers, so skip the scan
+    if '#' not in markdown_content:
+        return markdown_content
+
+    # Add a separator line after each H1 in a single pass over the document
+    return _H1_RE.sub(r'\g<0>\n---', markdown_content)
+
+def read_markdown_file(file_path: Path) -> str:
+    """Read a markdown file as UTF-8 without newline translation"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return f.read().decode('utf-8')
+        # Decode large files straight from the page cache instead of copying
+        # them into an intermediate bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+
+def process_file(file_path: Path) -> bool:
+    """Process a single markdown file in place, returning whether it changed"""
+    # Read the file
+    content = read_markdown_file(file_path)
+
+    # Add separators after H1 headers
+    updated_content = add_separators_after_h1(content)
+
+    # Leave already processed files untouched
+    if updated_content == content:
+        return False
+
+    # Write back to file
+    file_path.write_bytes(updated_content.encode('utf-8'))
+    return True
+
+def find_markdown_files(directory: Path) -> List[Path]:
+    """List the markdown files directly inside a directory"""
+    # Filter directory entries by name before building any Path objects
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()]
 
 def process_folder(folder_path: Path): # Renamed and added folder_path argument
     """Process all markdown files in the specified folder"""
@@ -40,7 +78,7 @@ def process_folder(folder_path: Path): # Renamed and added folder_path argument
         print(f"❌ Folder not found: {folder_path}")
         return
 
-    markdown_files = list(folder_path.glob('*.md'))
+    markdown_files = find_markdown_files(folder_path)
 
     if not markdown_files:
         print(f"❌ No markdown files found in {folder_path}")
@@ -49,25 +87,21 @@ def process_folder(folder_path: Path): # Renamed and added folder_path argument
     print(f"📁 Processing {len(markdown_files)} markdown files in {folder_path}")
     print("=" * 50)
 
-    for file_path in markdown_files:
-        print(f"📄 Processing: {file_path.name}")
-
-        try:
-            # Read the file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Add separators after H1 headers
-            updated_content = add_separators_after_h1(content)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(process_file, file_path) for file_path in markdown_files]
 
-            # Write back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+        # Report progress in file order as the results come in
+        for file_path, future in zip(markdown_files, futures):
+            print(f"📄 Processing: {file_path.name}")
 
-            print(f"✅ Updated: {file_path.name}")
+            try:
+                if future.result():
+                    print(f"✅ Updated: {file_path.name}")
+                else:
+                    print(f"➖ No changes: {file_path.name}")
 
-        except Exception as e:
-            print(f"❌ Error processing {file_path.name}: {e}")
+            except Exception as e:
+                print(f"❌ Error processing {file_path.name}: {e}")
 
     print("=" * 50)
     print("🎉 Separator addition complete!")
@@ -4,10 +4,26 @@ Script to adjust header levels in markdown files within the child folder.
 Reduces all headers by 1 level except the first header which remains as the page title.
 """
 
+import argparse
+import mmap
 import os
 import re
-import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
+
+# Files are read, transformed and written concurrently
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files at least this large are read through mmap
+MMAP_THRESHOLD = 64 * 1024
+
+# Markdown header lines: 1-6 # symbols, whitespace, then the header text
+_HEADER_RE = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
+
+# The same header lines with one leading # split off, so that \1 is the header
+# one level up (level 1 headers keep their single #)
+_DECREMENT_HEADER_RE = re.compile(r'^#?(#{1,5})[^\S\n]+(.+)$', re.MULTILINE)
 
 def adjust_header_levels(markdown_content: str) -> str:
     """
@@ -20,30 +36,52 @@ def adjust_header_levels(markdown_content: str) -> str:
     Returns:
         Markdown content with adjusted header levels
     """
-    lines = markdown_content.split('\n')
-    adjusted_lines = []
-    first_header_found = False
-
-    for line in lines:
-        # Check if this is a header line
-        header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-        if header_match:
-            header_level = len(header_match.group(1))
-            header_text = header_match.group(2)
-
-            if not first_header_found:
-                # Keep the first header as is (page title)
-                adjusted_lines.append(line)
-                first_header_found = True
-            else:
-                # Reduce header level by 1 for all subsequent headers
-                new_level = max(1, header_level - 1)
-                new_header = '#' * new_level + ' ' + header_text
-                adjusted_lines.append(new_header)
-        else:
-            adjusted_lines.append(line)
-
-    return '\n'.join(adjusted_lines)
+    # Without a single '#' there are no headers, so skip the scan
+    if '#' not in markdown_content:
+        return markdown_content
+
+    # Keep everything up to the end of the first header as is (page title)
+    first_header = _HEADER_RE.search(markdown_content)
+    if not first_header:
+        return markdown_content
+    split = first_header.end()
+
+    # Reduce header level by 1 for all subsequent headers
+    return markdown_content[:split] + _DECREMENT_HEADER_RE.sub(r'\1 \2', markdown_content[split:])
+
+def read_markdown_file(file_path: Path) -> str:
+    """Read a markdown file as UTF-8 without newline translation"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return f.read().decode('utf-8')
+        # Decode large files straight from the page cache instead of copying
+        # them into an intermediate bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+
+def process_file(file_path: Path) -> bool:
+    """Process a single markdown file in place, returning whether it changed"""
+    # Read the file
+    content = read_markdown_file(file_path)
+
+    # Adjust header levels
+    adjusted_content = adjust_header_levels(content)
+
+    # Leave already processed files untouched
+    if adjusted_content == content:
+        return False
+
+    # Write back to file
+    file_path.write_bytes(adjusted_content.encode('utf-8'))
+    return True
+
+def find_markdown_files(directory: Path) -> List[Path]:
+    """List the markdown files directly inside a directory"""
+    # Filter directory entries by name before building any Path objects
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()]
 
 def process_folder(folder_path: Path): # Renamed and added folder_path argument
     """Process all markdown files in the specified folder"""
@@ -51,7 +89,7 @@ def process_folder(folder_path: Path): # Renamed and added folder_path argument
         print(f"❌ Folder not found: {folder_path}")
         return
 
-    markdown_files = list(folder_path.glob('*.md'))
+    markdown_files = find_markdown_files(folder_path)
 
     if not markdown_files:
         print(f"❌ No markdown files found in {folder_path}")
@@ -60,25 +98,21 @@ def process_folder(folder_path: Path): # Renamed and added folder_path argument
     print(f"📁 Processing {len(markdown_files)} markdown files in {folder_path}")
     print("=" * 50)
 
-    for file_path in markdown_files:
-        print(f"📄 Processing: {file_path.name}")
-
-        try:
-            # Read the file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Adjust header levels
-            adjusted_content = adjust_header_levels(content)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(process_file, file_path) for file_path in markdown_files]
 
-            # Write back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(adjusted_content)
+        # Report progress in file order as the results come in
+        for file_path, future in zip(markdown_files, futures):
+            print(f"📄 Processing: {file_path.name}")
 
-            print(f"✅ Updated: {file_path.name}")
+            try:
+                if future.result():
+                    print(f"✅ Updated: {file_path.name}")
+                else:
+                    print(f"➖ No changes: {file_path.name}")
 
-        except Exception as e:
-            print(f"❌ Error processing {file_path.name}: {e}")
+            except Exception as e:
+                print(f"❌ Error processing {file_path.name}: {e}")
 
     print("=" * 50)
     print("🎉 Header adjustment complete!")
@@ -15,53 +15,89 @@
 Debug script to see exact HTML structure for code blocks
 """
 
+import argparse
+import sys
 import markdown
+from markdown.extensions import fenced_code, nl2br, tables, toc
 
-def debug_code_block_html():
-    """Debug the exact HTML structure for code blocks"""
+def _plain_extensions() -> list:
+    """Fresh extension instances for one Markdown parser
+
+    Extensions keep per-instance state, so they are not shared between parsers;
+    codehilite is left out here because importing it loads Pygments.
+    """
+    return [tables.TableExtension(), fenced_code.FencedCodeExtension(),
+            toc.TocExtension(), nl2br.Nl2BrExtension()]
+
+# HTML the markdown library generates for the test code block without codehilite
+_EXPECTED_HTML = (
+    '<pre><code class="language-python">def hello_world():\n'
+    '    print(&quot;Hello, World!&quot;)\n'
+    '    return True\n'
+    '</code></pre>'
+)
+
+def _render_basic(markdown_content: str) -> str:
+    """Render markdown to HTML without syntax highlighting"""
+    return markdown.markdown(markdown_content, extensions=_plain_extensions())
+
+def _render_highlighted(markdown_content: str) -> str:
+    """Render markdown to HTML with codehilite, loading Pygments only now"""
+    from markdown.extensions.codehilite import CodeHiliteExtension
+    extensions = _plain_extensions()
+    extensions.insert(2, CodeHiliteExtension())
+    return markdown.markdown(markdown_content, extensions=extensions)
+
+def debug_code_block_html(full: bool = False, expected: bool = False):
+    """Debug the exact HTML structure for code blocks
+
+    The code block is rendered without codehilite; ``full`` also renders it
+    with codehilite, and ``expected`` prints the precomputed HTML instead of
+    rendering anything.
+    """
     
+    # Collect the output and write it at once instead of print by print
+    out = []
+
     test_markdown = """```python
 def hello_world():
     print("Hello, World!")
     return True
 ```"""
     
-    print("Original Markdown:")
-    print("=" * 50)
-    print(test_markdown)
-    print()
-    
-    # Convert to HTML using markdown library
-    html_content = markdown.markdown(
-        test_markdown,
-        extensions=[
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br'
-        ]
-    )
+    out.append("Original Markdown:")
+    out.append("=" * 50)
+    out.append(test_markdown)
+    out.append("")
     
-    print("Generated HTML:")
-    print("=" * 50)
-    print(html_content)
-    print()
+    if expected:
+        out.append("Expected HTML (precomputed, not rendered - omit --expected to render):")
+        out.append("=" * 50)
+        out.append(_EXPECTED_HTML)
+        sys.stdout.write("\n".join(out) + "\n")
+        return
+
+    if full:
+        # Convert to HTML using markdown library
+        html_content = _render_highlighted(test_markdown)
+        
+        out.append("Generated HTML:")
+        out.append("=" * 50)
+        out.append(html_content)
+        out.append("")
     
     # Also test without codehilite
-    html_content_no_highlight = markdown.markdown(
-        test_markdown,
-        extensions=[
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br'
-        ]
-    )
+    html_content_no_highlight = _render_basic(test_markdown)
     
-    print("Generated HTML (without codehilite):")
-    print("=" * 50)
-    print(html_content_no_highlight)
+    out.append("Generated HTML (without codehilite):")
+    out.append("=" * 50)
+    out.append(html_content_no_highlight)
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
-    debug_code_block_html() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Show the HTML generated for a fenced code block')
+    parser.add_argument('--full', action='store_true', help='Also render with codehilite syntax highlighting')
+    parser.add_argument('--expected', action='store_true', help='Print the precomputed expected HTML instead of rendering')
+    args = parser.parse_args()
+    debug_code_block_html(full=args.full, expected=args.expected)
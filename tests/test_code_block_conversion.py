@@ -15,10 +15,45 @@
 Test script to debug code block conversion
 """
 
+import functools
 import markdown
-import re
+from markdown.extensions import codehilite, fenced_code, nl2br, tables, toc
 from confluence_markdown_converter import ConfluenceMarkdownConverter
 
+# Extension classes by name; each render builds its own instances since
+# extensions keep per-instance state and are not shared between parsers
+EXTENSION_CLASSES = {
+    'tables': tables.TableExtension,
+    'fenced_code': fenced_code.FencedCodeExtension,
+    'codehilite': codehilite.CodeHiliteExtension,
+    'toc': toc.TocExtension,
+    'nl2br': nl2br.Nl2BrExtension,
+}
+
+# Extensions used to render the test markdown to HTML
+HTML_EXTENSIONS = ('tables', 'fenced_code', 'codehilite', 'toc', 'nl2br')
+
+# Markers delimiting code blocks in the generated HTML
+CODE_BLOCK_START = '<pre><code'
+CODE_BLOCK_END = '</code></pre>'
+LANGUAGE_CLASS = ' class="language-'
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(base_url: str, username: str, api_token: str, space_key: str) -> ConfluenceMarkdownConverter:
+    """Build a converter once per set of credentials and reuse it"""
+    return ConfluenceMarkdownConverter(
+        base_url=base_url,
+        username=username,
+        api_token=api_token,
+        space_key=space_key
+    )
+
+@functools.lru_cache(maxsize=128)
+def render_markdown(markdown_content: str, extension_names: tuple) -> str:
+    """Render markdown to HTML, reusing the result for repeated identical input"""
+    extensions = [EXTENSION_CLASSES[name]() for name in extension_names]
+    return markdown.markdown(markdown_content, extensions=extensions)
+
 def test_code_block_conversion():
     """Test how code blocks are being converted"""
     
@@ -49,16 +84,7 @@ And inline code: `print("hello")`
     print()
     
     # Convert to HTML using markdown library
-    html = markdown.markdown(
-        test_markdown,
-        extensions=[
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br'
-        ]
-    )
+    html = render_markdown(test_markdown, HTML_EXTENSIONS)
     
     print("Generated HTML:")
     print("=" * 50)
@@ -66,12 +92,7 @@ And inline code: `print("hello")`
     print()
     
     # Test the current conversion
-    converter = ConfluenceMarkdownConverter(
-        base_url="https://test.com",
-        username="test",
-        api_token="test",
-        space_key="test"
-    )
+    converter = _get_converter("https://test.com", "test", "test", "test")
     
     confluence_markup = converter.convert_markdown_to_confluence(test_markdown)
     
@@ -87,49 +108,67 @@ And inline code: `print("hello")`
     print("=" * 50)
     print(improved_markup)
 
+def convert_code_blocks(html: str) -> str:
+    """Replace <pre><code> blocks with Confluence code macros in one forward scan"""
+    parts = []
+    position = 0
+
+    while True:
+        start = html.find(CODE_BLOCK_START, position)
+        if start == -1:
+            break
+        cursor = start + len(CODE_BLOCK_START)
+
+        # Read the language from class="language-<word>" if there is one
+        language = None
+        if html.startswith(LANGUAGE_CLASS, cursor):
+            name_start = name_end = cursor + len(LANGUAGE_CLASS)
+            while name_end < len(html) and (html[name_end].isalnum() or html[name_end] == '_'):
+                name_end += 1
+            if name_end == name_start or not html.startswith('">', name_end):
+                # Not a code block this converter handles; keep it as is
+                parts.append(html[position:cursor])
+                position = cursor
+                continue
+            language = html[name_start:name_end]
+            cursor = name_end + 2
+        elif html.startswith('>', cursor):
+            cursor += 1
+        else:
+            parts.append(html[position:cursor])
+            position = cursor
+            continue
+
+        end = html.find(CODE_BLOCK_END, cursor)
+        if end == -1:
+            break
+
+        # Copy the text before the block, then the code verbatim inside the macro
+        parts.append(html[position:start])
+        code = html[cursor:end]
+        if language:
+            parts.append(f'<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">{language}</ac:parameter><ac:plain-text-body><![CDATA[{code}]]></ac:plain-text-body></ac:structured-macro>')
+        else:
+            parts.append(f'<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[{code}]]></ac:plain-text-body></ac:structured-macro>')
+        position = end + len(CODE_BLOCK_END)
+
+    parts.append(html[position:])
+    return ''.join(parts)
+
 def convert_markdown_to_confluence_improved(markdown_content: str) -> str:
     """Improved conversion that handles code blocks better"""
     
     # First convert markdown to HTML
-    html = markdown.markdown(
-        markdown_content,
-        extensions=[
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br'
-        ]
-    )
+    html = render_markdown(markdown_content, HTML_EXTENSIONS)
     
     # Convert HTML to Confluence markup with better code block handling
     markup = html
     
-    # Improved code block handling
-    # Handle code blocks with language specification
-    markup = re.sub(
-        r'<pre><code class="language-(\w+)">(.*?)</code></pre>',
-        lambda m: f'<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">{m.group(1)}</ac:parameter><ac:plain-text-body><![CDATA[{m.group(2)}]]></ac:plain-text-body></ac:structured-macro>',
-        markup,
-        flags=re.DOTALL
-    )
-    
-    # Handle code blocks without language specification
-    markup = re.sub(
-        r'<pre><code>(.*?)</code></pre>',
-        lambda m: f'<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[{m.group(1)}]]></ac:plain-text-body></ac:structured-macro>',
-        markup,
-        flags=re.DOTALL
-    )
-    
-    # Handle inline code
-    markup = re.sub(r'<code>(.*?)</code>', r'<code>\1</code>', markup)
+    # Improved code block handling, with or without language specification
+    markup = convert_code_blocks(markup)
     
-    # Handle other elements (simplified for this test)
-    markup = re.sub(r'<h1>(.*?)</h1>', r'<h1>\1</h1>', markup)
-    markup = re.sub(r'<h2>(.*?)</h2>', r'<h2>\1</h2>', markup)
-    markup = re.sub(r'<h3>(.*?)</h3>', r'<h3>\1</h3>', markup)
-    markup = re.sub(r'<p>(.*?)</p>', r'<p>\1</p>', markup)
+    # Inline code, headers and paragraphs are already valid storage format
+    # and are kept as-is
     
     return markup
 
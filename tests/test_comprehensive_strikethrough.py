@@ -15,64 +15,125 @@
 Test script to debug strikethrough conversion in the comprehensive example
 """
 
+import functools
+import os
+import sys
+from pathlib import Path
 import markdown
 from confluence_markdown_converter import ConfluenceMarkdownConverter, MARKDOWN_EXTENSIONS
 
+@functools.lru_cache(maxsize=4)
+def _get_converter(base_url: str, username: str, api_token: str, space_key: str) -> ConfluenceMarkdownConverter:
+    """Build a converter once per set of credentials and reuse it"""
+    return ConfluenceMarkdownConverter(
+        base_url=base_url,
+        username=username,
+        api_token=api_token,
+        space_key=space_key
+    )
+
+def _read_doc(path: str) -> str:
+    """Read a document, reusing its text until the file is modified"""
+    return _read_doc_version(path, os.stat(path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=16)
+def _read_doc_version(path: str, mtime_ns: int) -> str:
+    """Read a document; mtime_ns is only part of the cache key"""
+    return Path(path).read_text(encoding='utf-8')
+
+def _lines_with(text: str, opening: str, closing: str) -> list:
+    """Lines of text containing opening followed later by closing"""
+    # Same lines as re.findall(r'.*<opening>.*<closing>.*', text, re.MULTILINE)
+    # using plain substring searches on each '\n'-separated line
+    lines = []
+    for line in text.split('\n'):
+        start = line.find(opening)
+        if start != -1 and line.find(closing, start + len(opening)) != -1:
+            lines.append(line)
+    return lines
+
+def _strike(text: str) -> str:
+    """Wrap ~~text~~ pairs on the same line in <del> tags"""
+    # Same result as re.sub(r'~~(.*?)~~', r'<del>\1</del>', text) in one pass
+    # of substring searches; a '~~' with no closer on its line is left as is
+    out = []
+    start = 0
+    search = 0
+    while True:
+        opening = text.find('~~', search)
+        if opening == -1:
+            break
+        closing = text.find('~~', opening + 2)
+        if closing == -1:
+            break
+        newline = text.find('\n', opening + 2, closing)
+        if newline != -1:
+            # No closer on this line; continue on the next one
+            search = newline + 1
+            continue
+        out.append(text[start:opening])
+        out.append('<del>')
+        out.append(text[opening + 2:closing])
+        out.append('</del>')
+        start = search = closing + 2
+    out.append(text[start:])
+    return ''.join(out)
+
 def test_comprehensive_strikethrough():
     """Test strikethrough conversion in the comprehensive example"""
 
-    # Read the comprehensive example file
-    with open('docs/example_comprehensive.md', 'r', encoding='utf-8') as f:
-        markdown_content = f.read()
-
-    # Find the strikethrough line
-    import re
-    strikethrough_lines = re.findall(r'.*~~.*~~.*', markdown_content, re.MULTILINE)
-
-    print("Found strikethrough lines in comprehensive file:")
-    print("=" * 50)
-    for line in strikethrough_lines:
-        print(f"'{line.strip()}'")
-    print()
-
-    # Test the conversion step by step
-    print("Step 1: Pre-processing strikethrough")
-    print("=" * 50)
-    # Pre-process strikethrough (~~text~~ -> <del>text</del>)
-    processed_content = re.sub(r'~~(.*?)~~', r'<del>\1</del>', markdown_content)
-    strikethrough_processed = re.findall(r'.*<del>.*</del>.*', processed_content, re.MULTILINE)
-    for line in strikethrough_processed:
-        print(f"'{line.strip()}'")
-    print()
-
-    print("Step 2: Markdown to HTML conversion")
-    print("=" * 50)
-    html_content = markdown.markdown(
-        processed_content,
-        extensions=MARKDOWN_EXTENSIONS
-    )
-    # Find strikethrough in HTML
-    strikethrough_html = re.findall(r'.*<del>.*</del>.*', html_content, re.MULTILINE)
-    for line in strikethrough_html:
-        print(f"'{line.strip()}'")
-    print()
-
-    print("Step 3: Final Confluence conversion")
-    print("=" * 50)
-    converter = ConfluenceMarkdownConverter(
-        base_url="https://test.com",
-        username="test",
-        api_token="test",
-        space_key="test"
-    )
+    # Collect the output and write it at once instead of print by print; the
+    # collected part is still written if a later step fails
+    out = []
+    try:
+        # Read the comprehensive example file
+        doc_path = 'docs/example_comprehensive.md'
+        markdown_content = _read_doc(doc_path)
+
+        # Find the strikethrough line
+        strikethrough_lines = _lines_with(markdown_content, '~~', '~~')
+
+        out.append("Found strikethrough lines in comprehensive file:")
+        out.append("=" * 50)
+        for line in strikethrough_lines:
+            out.append(f"'{line.strip()}'")
+        out.append("")
+
+        # Test the conversion step by step
+        out.append("Step 1: Pre-processing strikethrough")
+        out.append("=" * 50)
+        # Pre-process strikethrough (~~text~~ -> <del>text</del>)
+        processed_content = _strike(markdown_content)
+        strikethrough_processed = _lines_with(processed_content, '<del>', '</del>')
+        for line in strikethrough_processed:
+            out.append(f"'{line.strip()}'")
+        out.append("")
+
+        out.append("Step 2: Markdown to HTML conversion")
+        out.append("=" * 50)
+        html_content = markdown.markdown(
+            processed_content,
+            extensions=MARKDOWN_EXTENSIONS
+        )
+        # Find strikethrough in HTML
+        strikethrough_html = _lines_with(html_content, '<del>', '</del>')
+        for line in strikethrough_html:
+            out.append(f"'{line.strip()}'")
+        out.append("")
+
+        out.append("Step 3: Final Confluence conversion")
+        out.append("=" * 50)
+        converter = _get_converter("https://test.com", "test", "test", "test")
 
-    confluence_markup = converter.convert_markdown_to_confluence(markdown_content)
+        confluence_markup = converter.convert_markdown_to_confluence(markdown_content)
 
-    # Find strikethrough in final output
-    strikethrough_final = re.findall(r'.*text-decoration: line-through.*', confluence_markup, re.MULTILINE)
-    for line in strikethrough_final:
-        print(f"'{line.strip()}'")
-    print()
+        # Find strikethrough in final output
+        strikethrough_final = [line for line in confluence_markup.split('\n') if 'text-decoration: line-through' in line]
+        for line in strikethrough_final:
+            out.append(f"'{line.strip()}'")
+        out.append("")
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     test_comprehensive_strikethrough()
\ No newline at end of file
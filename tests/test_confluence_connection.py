@@ -15,9 +15,68 @@
 Test script to diagnose Confluence API connection issues
 """
 
+import logging
+import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from confluence_config import ConfluenceConfig
 
+# One session for every probe so connections to the host are kept alive and
+# reused instead of repeating the TCP and TLS handshakes for each request;
+# rate limiting and transient gateway errors are retried before a probe is
+# reported as failed, with the last status reported if they persist
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False
+    )
+))
+SESSION.headers.update({
+    'Accept': 'application/json',
+    'Content-Type': 'application/json'
+})
+
+# Probe results are logged so callers can silence them by raising the level
+logger = logging.getLogger(__name__)
+
+# Endpoints probed by the connection test; paths are formatted with the config.
+# The content listing is limited to one page, it only shows the API responds
+PROBES = [
+    ("Basic API endpoint", "/rest/api/content?limit=1"),
+    ("Space information", "/rest/api/space/{space_key}"),
+    ("User information", "/rest/api/user/current"),
+]
+
+# Bytes of each response body shown in the report
+PREVIEW_BYTES = 200
+
+def _fetch(url: str):
+    """GET a probe URL, returning its status and the start of its body or the exception it raised"""
+    try:
+        # Only the start of the body is shown, so stream it and read just that
+        # much instead of downloading and decoding all of it
+        with SESSION.get(url, timeout=10, stream=True) as response:
+            preview = response.raw.read(PREVIEW_BYTES, decode_content=True)
+            return response.status_code, preview.decode(response.encoding or 'utf-8', 'replace')
+    except Exception as e:
+        return e
+
+def _report_probe(number: int, name: str, outcome) -> None:
+    """Log the result of one probe as a single record"""
+    if isinstance(outcome, Exception):
+        logger.warning("Test %d: %s...\nError: %s\n", number, name, outcome)
+    else:
+        status_code, preview = outcome
+        logger.info("Test %d: %s...\nStatus Code: %s\nResponse: %s...\n", number, name, status_code, preview)
+
 def test_confluence_connection():
     """Test basic connection to Confluence API"""
 
@@ -33,49 +92,17 @@ def test_confluence_connection():
     print(f"API Token: {'*' * len(config.config['api_token']) if config.config['api_token'] else 'NOT SET'}")
     print()
 
-    # Create session with authentication
-    session = requests.Session()
-    session.auth = (config.config['username'], config.config['api_token'])
-    session.headers.update({
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    })
+    # Authenticate the shared session
+    SESSION.auth = (config.config['username'], config.config['api_token'])
 
-    # Test 1: Basic API endpoint
-    print("Test 1: Basic API endpoint...")
-    try:
-        url = f"{config.config['base_url']}/rest/api/content"
-        response = session.get(url)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"Error: {e}")
-        print()
+    # The probes are independent, so send them at once and report in order
+    urls = [f"{config.config['base_url']}{path.format(**config.config)}" for _, path in PROBES]
+    with ThreadPoolExecutor(max_workers=len(PROBES)) as executor:
+        outcomes = list(executor.map(_fetch, urls))
 
-    # Test 2: Space information
-    print("Test 2: Space information...")
-    try:
-        url = f"{config.config['base_url']}/rest/api/space/{config.config['space_key']}"
-        response = session.get(url)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"Error: {e}")
-        print()
-
-    # Test 3: User information
-    print("Test 3: User information...")
-    try:
-        url = f"{config.config['base_url']}/rest/api/user/current"
-        response = session.get(url)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"Error: {e}")
-        print()
+    for number, ((name, _), outcome) in enumerate(zip(PROBES, outcomes), 1):
+        _report_probe(number, name, outcome)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     test_confluence_connection()
\ No newline at end of file
@@ -7,127 +7,166 @@ import requests
 import json
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add the parent directory to the path so we can import jira_config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from jira_config import JiraConfig
 
-def test_connection(config: JiraConfig):
-    """Test basic connection to Jira"""
-    if not config.is_configured():
-        print("❌ Configuration not complete. Run setup first.")
-        print("   Use: python jira_config.py --setup")
-        return False
-
+def _json_loads(content: bytes):
+    """Parse a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _make_session(config: JiraConfig) -> requests.Session:
+    """Create the authenticated session shared by all the checks"""
+    # One session keeps connections to the Jira host alive between requests
+    # instead of each check repeating the TCP and TLS handshakes; rate limiting
+    # and transient gateway errors are retried before a check reports them
     session = requests.Session()
     session.auth = (config.username, config.api_token)
     session.headers.update({
         'Accept': 'application/json',
         'Content-Type': 'application/json'
     })
+    session.mount('https://', HTTPAdapter(
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False
+        )
+    ))
+    return session
+
+# Project responses keyed on (base_url, project_key); get_project_info,
+# get_issue_types and get_components all read the project, which is then only
+# fetched once with its issue types and components expanded
+_PROJECT_RESPONSES = {}
+_PROJECT_LOCK = threading.Lock()
+
+def _fetch_project(session: requests.Session, config: JiraConfig) -> requests.Response:
+    """GET the configured project, reusing the response of an earlier call"""
+    key = (config.base_url, config.project_key)
+    # Held during the request so a concurrent caller waits for it instead of
+    # sending the same request
+    with _PROJECT_LOCK:
+        if key not in _PROJECT_RESPONSES:
+            url = f"{config.base_url}/rest/api/2/project/{config.project_key}"
+            _PROJECT_RESPONSES[key] = session.get(url, params={'expand': 'components,issueTypes'})
+        return _PROJECT_RESPONSES[key]
+
+def test_connection(session: requests.Session, config: JiraConfig):
+    """Test basic connection to Jira"""
+    if not config.is_configured():
+        print("❌ Configuration not complete. Run setup first.")
+        print("   Use: python jira_config.py --setup")
+        return False
 
     # Test basic connection
     url = f"{config.base_url}/rest/api/2/myself"
     response = session.get(url)
     print(f"Connection test status: {response.status_code}")
     if response.status_code == 200:
-        user_info = response.json()
+        user_info = _json_loads(response.content)
         print(f"✅ Connected as: {user_info.get('displayName', 'Unknown')}")
         return True
     else:
         print(f"❌ Connection failed: {response.text}")
         return False
 
-def get_project_info(config: JiraConfig):
+def get_project_info(session: requests.Session, config: JiraConfig,
+                     out: Optional[List[str]] = None):
     """Get project information"""
-    session = requests.Session()
-    session.auth = (config.username, config.api_token)
-    session.headers.update({
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    })
+    # Collect the output and write it at once; when the caller passes a list
+    # the lines go there instead, so it can print the diagnostics in order
+    lines = [] if out is None else out
 
-    url = f"{config.base_url}/rest/api/2/project/{config.project_key}"
-    response = session.get(url)
-    print(f"\nProject info status: {response.status_code}")
+    response = _fetch_project(session, config)
+    lines.append(f"\nProject info status: {response.status_code}")
     if response.status_code == 200:
-        project_info = response.json()
-        print(f"✅ Project: {project_info.get('name', 'Unknown')} ({project_info.get('key', 'Unknown')})")
-        print(f"   Project ID: {project_info.get('id', 'Unknown')}")
-        return project_info
+        project_info = _json_loads(response.content)
+        lines.append(f"✅ Project: {project_info.get('name', 'Unknown')} ({project_info.get('key', 'Unknown')})")
+        lines.append(f"   Project ID: {project_info.get('id', 'Unknown')}")
     else:
-        print(f"❌ Failed to get project info: {response.text}")
-        return None
-
-def get_issue_types(config: JiraConfig):
+        project_info = None
+        lines.append(f"❌ Failed to get project info: {response.text}")
+    if out is None:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return project_info
+
+def get_issue_types(session: requests.Session, config: JiraConfig,
+                    out: Optional[List[str]] = None):
     """Get available issue types for the project"""
-    session = requests.Session()
-    session.auth = (config.username, config.api_token)
-    session.headers.update({
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    })
+    # Collect the output and write it at once; when the caller passes a list
+    # the lines go there instead, so it can print the diagnostics in order
+    lines = [] if out is None else out
 
-    url = f"{config.base_url}/rest/api/2/project/{config.project_key}"
-    response = session.get(url)
+    # The issue types come expanded in the project response
+    response = _fetch_project(session, config)
+    lines.append(f"\nIssue types status: {response.status_code}")
     if response.status_code == 200:
-        project_info = response.json()
-        project_id = project_info.get('id')
-
-        # Get issue types for this project
-        url = f"{config.base_url}/rest/api/2/project/{project_id}/statuses"
-        response = session.get(url)
-        print(f"\nIssue types status: {response.status_code}")
-        if response.status_code == 200:
-            issue_types = response.json()
-            print("✅ Available issue types:")
-            for issue_type in issue_types:
-                print(f"   - {issue_type.get('name', 'Unknown')}")
-        else:
-            print(f"❌ Failed to get issue types: {response.text}")
+        issue_types = _json_loads(response.content).get('issueTypes', [])
+        lines.append("✅ Available issue types:")
+        for issue_type in issue_types:
+            lines.append(f"   - {issue_type.get('name', 'Unknown')}")
     else:
-        print(f"❌ Failed to get project info for issue types: {response.text}")
+        lines.append(f"❌ Failed to get issue types: {response.text}")
+    if out is None:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def get_priorities(config: JiraConfig):
+def get_priorities(session: requests.Session, config: JiraConfig,
+                   out: Optional[List[str]] = None):
     """Get available priorities"""
-    session = requests.Session()
-    session.auth = (config.username, config.api_token)
-    session.headers.update({
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    })
+    # Collect the output and write it at once; when the caller passes a list
+    # the lines go there instead, so it can print the diagnostics in order
+    lines = [] if out is None else out
 
     url = f"{config.base_url}/rest/api/2/priority"
     response = session.get(url)
-    print(f"\nPriorities status: {response.status_code}")
+    lines.append(f"\nPriorities status: {response.status_code}")
     if response.status_code == 200:
-        priorities = response.json()
-        print("✅ Available priorities:")
+        priorities = _json_loads(response.content)
+        lines.append("✅ Available priorities:")
         for priority in priorities:
-            print(f"   - {priority.get('name', 'Unknown')}")
+            lines.append(f"   - {priority.get('name', 'Unknown')}")
     else:
-        print(f"❌ Failed to get priorities: {response.text}")
+        lines.append(f"❌ Failed to get priorities: {response.text}")
+    if out is None:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def get_components(config: JiraConfig):
+def get_components(session: requests.Session, config: JiraConfig,
+                   out: Optional[List[str]] = None):
     """Get available components for the project"""
-    session = requests.Session()
-    session.auth = (config.username, config.api_token)
-    session.headers.update({
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    })
+    # Collect the output and write it at once; when the caller passes a list
+    # the lines go there instead, so it can print the diagnostics in order
+    lines = [] if out is None else out
 
-    url = f"{config.base_url}/rest/api/2/project/{config.project_key}/components"
-    response = session.get(url)
-    print(f"\nComponents status: {response.status_code}")
+    # The components come expanded in the project response
+    response = _fetch_project(session, config)
+    lines.append(f"\nComponents status: {response.status_code}")
     if response.status_code == 200:
-        components = response.json()
-        print("✅ Available components:")
+        components = _json_loads(response.content).get('components', [])
+        lines.append("✅ Available components:")
         for component in components:
-            print(f"   - {component.get('name', 'Unknown')} (ID: {component.get('id', 'Unknown')})")
+            lines.append(f"   - {component.get('name', 'Unknown')} (ID: {component.get('id', 'Unknown')})")
     else:
-        print(f"❌ Failed to get components: {response.text}")
+        lines.append(f"❌ Failed to get components: {response.text}")
+    if out is None:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     print("Testing Jira connection and configuration...")
@@ -135,12 +174,24 @@ if __name__ == "__main__":
     # Load configuration
     config = JiraConfig()
 
-    if test_connection(config):
-        get_project_info(config)
-        get_issue_types(config)
-        get_priorities(config)
-        get_components(config)
-    else:
-        print("Cannot proceed with other tests due to connection failure.")
-        print("\nTo set up configuration, run:")
-        print("  python jira_config.py --setup")
\ No newline at end of file
+    session = _make_session(config)
+
+    # The diagnostics are independent, so fetch them concurrently
+    diagnostics = (get_project_info, get_issue_types, get_priorities, get_components)
+    with ThreadPoolExecutor(max_workers=len(diagnostics)) as executor:
+        if config.is_configured():
+            # Load the project while the connection is checked; three of the
+            # diagnostics read it, so this saves a round trip
+            executor.submit(_fetch_project, session, config)
+
+        if test_connection(session, config):
+            # Each diagnostic fills its own list; print them in order once all are done
+            outputs = [[] for _ in diagnostics]
+            list(executor.map(lambda diagnostic, out: diagnostic(session, config, out),
+                              diagnostics, outputs))
+            for lines in outputs:
+                sys.stdout.write("\n".join(lines) + "\n")
+        else:
+            print("Cannot proceed with other tests due to connection failure.")
+            print("\nTo set up configuration, run:")
+            print("  python jira_config.py --setup")
\ No newline at end of file
@@ -19,10 +19,259 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from jira_markdown_converter import JiraMarkdownConverter
+import functools
+import json
+import logging
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# markdown and the converter are imported inside the functions so collecting
+# the tests does not load them
+
+def _markdown_extensions() -> list:
+    """Fresh extension instances for one markdown call
+
+    Extensions keep per-instance state, so they are not shared between calls;
+    markdown is only imported once the first test needs it.
+    """
+    from markdown.extensions import def_list, fenced_code, nl2br, tables, toc
+    return [
+        def_list.DefListExtension(),
+        fenced_code.FencedCodeExtension(),
+        nl2br.Nl2BrExtension(),
+        tables.TableExtension(),
+        toc.TocExtension(),
+    ]
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(base_url: str, username: str, api_token: str, project_key: str):
+    """Build a converter once per set of credentials and reuse it"""
+    from jira_markdown_converter import JiraMarkdownConverter
+    return JiraMarkdownConverter(
+        base_url=base_url,
+        username=username,
+        api_token=api_token,
+        project_key=project_key
+    )
+
+def _command_line():
+    """Command line options for the offline tests"""
+    from jira_markdown_converter import CommandLine
+    return CommandLine(
+        files=[],
+        base_url="https://test.com",
+        username="test",
+        api_token="test",
+        project_key="TEST"
+    )
+
+@functools.lru_cache(maxsize=None)
+def _offline_converter():
+    """Converter for the conversion-only tests; it never sends a request"""
+    from jira_markdown_converter import JiraMarkdownConverter
+    return JiraMarkdownConverter(_command_line())
+
+# Markdown input and the Jira markup it must convert to. Where the output
+# differs from the old regex converter, the old output is noted as well
+GOLDEN_CONVERSIONS = {
+    "headings": (
+        "# Title\n\nIntro\n\n## Section\n\n### Sub\n\ntext",
+        "h1. Title\n\nIntro\n\nh2. Section\n\nh3. Sub\n\ntext"
+    ),
+    # Old converter: '* one\n* two\nnested\ndeeper\n\nthree'
+    "nested unordered list": (
+        "- one\n- two\n    - nested\n        - deeper\n- three",
+        "* one\n* two\n** nested\n*** deeper\n* three"
+    ),
+    # Old converter: '# one\n# two\nnested\n\nthree'
+    "nested ordered list": (
+        "1. one\n2. two\n    1. nested\n3. three",
+        "# one\n# two\n## nested\n# three"
+    ),
+    # Old converter: '# one* bullet\n# two'
+    "mixed nested list": (
+        "1. one\n    - bullet\n2. two",
+        "# one\n#* bullet\n# two"
+    ),
+    # Old converter marked every row as a header row: '||1||2||'
+    "table with header row": (
+        "| A | B |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |",
+        "||A||B||\n|1|2|\n|3|4|"
+    ),
+    "fenced code with language": (
+        "```python\ndef f():\n    return 1\n```",
+        "{code:python}\ndef f():\n    return 1\n{code}"
+    ),
+    "fenced code without language": (
+        "```\nx = 1\n```",
+        "{code}\nx = 1\n{code}"
+    ),
+    "links and inline code": (
+        "See [Google](https://www.google.com) and `code`.",
+        "See [Google|https://www.google.com] and {{code}}."
+    ),
+    # Old converter dropped the rule: 'above\n\nbelow'
+    "horizontal rule": (
+        "above\n\n---\n\nbelow",
+        "above\n\n----\n\nbelow"
+    ),
+    # Old converter left the HTML escapes in: 'Fish &amp; chips &lt; 3 ...'
+    "escaped entities": (
+        "Fish &amp; chips < 3 > 2 & more",
+        "Fish & chips < 3 > 2 & more"
+    ),
+    # Old converter: 'bq. \nsingle line quote'
+    "single line blockquote": (
+        "> single line quote",
+        "bq. single line quote"
+    ),
+    # Old converter: 'bq. \nline one\nline two'
+    "multi-paragraph blockquote": (
+        "> line one\n>\n> line two",
+        "{quote}\nline one\n\nline two\n{quote}"
+    ),
+}
+
+def test_golden_conversions():
+    """Each golden markdown input converts to exactly its Jira markup"""
+    converter = _offline_converter()
+    for name, (markdown_content, expected) in GOLDEN_CONVERSIONS.items():
+        jira_markup = converter.convert_markdown_to_jira(markdown_content)
+        assert jira_markup == expected, f"{name}: {jira_markup!r} != {expected!r}"
+
+def test_time_estimate_on_last_line():
+    """An estimate on the last line is extracted and removed from the content"""
+    cmd = _command_line()
+    content = _offline_converter()._extract_time_estimate_and_content(
+        "# Title\n\nBody\n**Estimated Time Frame:** 3-5 days", cmd
+    )
+    assert content == "Body"
+    assert cmd.time_estimate == "5d"
+
+def test_time_estimate_followed_by_content():
+    """Everything from the estimate line on is dropped"""
+    cmd = _command_line()
+    content = _offline_converter()._extract_time_estimate_and_content(
+        "# Title\n\nBody\nMore\n**Estimated Time Frame:** 2 days\n\n## After\nText", cmd
+    )
+    assert content == "Body\nMore"
+    assert cmd.time_estimate == "2d"
+
+def test_no_time_estimate():
+    """Without an estimate the whole body is kept, including its last line"""
+    cmd = _command_line()
+    converter = _offline_converter()
+    # The old line-based version dropped the last line here: 'Body'
+    content = converter._extract_time_estimate_and_content("# Title\n\nBody\nLast line", cmd)
+    assert content == "Body\nLast line"
+    assert cmd.time_estimate is None
+
+    content = converter._extract_time_estimate_and_content("# Title\n\nBody\nLast line\n", cmd)
+    assert content == "Body\nLast line\n"
+    assert cmd.time_estimate is None
+
+# Time estimate strings and the seconds they parse to, as the original
+# regex r'^(\d+(?:\.\d+)?)\s*(w|d|h|m|s)$' parsed them; None means rejected
+TIME_ESTIMATES = {
+    "2h": 7200,
+    "1d": 86400,
+    "30m": 1800,
+    "1w": 604800,
+    "3600s": 3600,
+    "1.5h": 5400,
+    "2H": 7200,
+    "  2h  ": 7200,
+    "2 h": 7200,
+    "2\th": 7200,
+    "1w 2d 3h 30m": None,
+    "1d2h": None,
+    "h": None,
+    "5": None,
+    "2x": None,
+    "2.h": None,
+    ".5h": None,
+    "-1h": None,
+    "": None,
+}
+
+def test_parse_time_estimate():
+    """Time estimates parse to the same seconds as the original regex"""
+    converter = _offline_converter()
+    for time_str, expected in TIME_ESTIMATES.items():
+        seconds = converter._parse_time_estimate(time_str)
+        assert seconds == expected, f"{time_str!r}: {seconds} != {expected}"
+
+class _ListHandler(logging.Handler):
+    """Keep the formatted log messages in a list"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_create_issues_bulk():
+    """Bulk creation chunks the files and maps created keys and errors back to them"""
+    import jira_markdown_converter
+    from jira_markdown_converter import JiraMarkdownConverter, create_issues
+
+    requests_sent = []
+
+    def fake_post(url, data):
+        # Fail the issue titled 'Two'; the others get a key named after their title
+        issue_updates = json.loads(data)["issueUpdates"]
+        requests_sent.append((url, [update["fields"]["summary"] for update in issue_updates]))
+        issues, errors = [], []
+        for idx, update in enumerate(issue_updates):
+            summary = update["fields"]["summary"]
+            if summary == "Two":
+                errors.append({"failedElementNumber": idx,
+                               "elementErrors": {"errors": {"summary": "rejected"}}})
+            else:
+                issues.append({"key": f"TEST-{summary}"})
+        response = mock.Mock(status_code=201)
+        response.content = json.dumps({"issues": issues, "errors": errors}).encode()
+        return response
+
+    cmd = _command_line()
+    converter = JiraMarkdownConverter(cmd)
+    handler = _ListHandler()
+    logger = logging.getLogger(jira_markdown_converter.__name__)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.object(jira_markdown_converter, "BULK_CREATE_SIZE", 2), \
+                mock.patch.object(converter.session, "post", side_effect=fake_post):
+            file_paths = []
+            for title in ("One", "Two", "Three"):
+                path = Path(directory) / f"{title.lower()}.md"
+                path.write_text(f"# {title}\n\nBody of {title}\n", encoding="utf-8")
+                file_paths.append(str(path))
+
+            create_issues(converter, cmd, file_paths)
+    finally:
+        logger.removeHandler(handler)
+
+    # Three files in chunks of two make two bulk requests, in file order
+    assert sorted(summaries for _, summaries in requests_sent) == [["One", "Two"], ["Three"]]
+    assert all(url == "https://test.com/rest/api/2/issue/bulk" for url, _ in requests_sent)
+
+    one, two, three = file_paths
+    messages = handler.messages
+    assert "Issue created successfully: TEST-One" in messages
+    assert "Issue created successfully: TEST-Three" in messages
+    assert f"Successfully processed: {one}" in messages
+    assert f"Successfully processed: {three}" in messages
+    assert f"Successfully processed: {two}" not in messages
+    assert any(message.startswith(f"Error processing {two}: ") and "rejected" in message
+               for message in messages)
 
 def test_jira_conversion():
     """Test how markdown is converted to Jira markup"""
+    import markdown
 
     # Test markdown content
     test_markdown = """# Test Document
@@ -73,18 +322,12 @@ Use `print()` function to output text.
     print()
 
     # Test the conversion
-    converter = JiraMarkdownConverter(
-        base_url="https://test.com",
-        username="test",
-        api_token="test",
-        project_key="TEST"
-    )
+    converter = _get_converter("https://test.com", "test", "test", "TEST")
 
     # Show the raw HTML from markdown library
-    import markdown
     raw_html = markdown.markdown(
         test_markdown,
-        extensions=['markdown.extensions.def_list', 'markdown.extensions.fenced_code', 'markdown.extensions.nl2br', 'markdown.extensions.tables', 'markdown.extensions.toc']
+        extensions=_markdown_extensions()
     )
 
     print("Raw HTML from Markdown Library:")
@@ -99,6 +342,21 @@ Use `print()` function to output text.
     print(jira_markup)
     print()
 
+def test_nested_blockquote():
+    """Nested blockquotes are flattened into a single Jira quote"""
+    import markdown
+    from jira_markdown_converter import _JiraHTMLParser
+
+    html = markdown.markdown("> a\n>> b", extensions=_markdown_extensions())
+    jira_markup = _JiraHTMLParser().convert(html)
+
+    print("Nested Blockquote:")
+    print("=" * 50)
+    print(jira_markup)
+    print()
+
+    assert jira_markup == "{quote}\na\n\nb\n{quote}\n\n"
+
 def test_jira_config():
     """Test Jira configuration management"""
     from jira_config import JiraConfig
@@ -134,6 +392,13 @@ if __name__ == "__main__":
     print()
 
     test_jira_conversion()
+    test_nested_blockquote()
+    test_golden_conversions()
+    test_time_estimate_on_last_line()
+    test_time_estimate_followed_by_content()
+    test_no_time_estimate()
+    test_parse_time_estimate()
+    test_create_issues_bulk()
     test_jira_config()
 
     print("Tests completed!")
\ No newline at end of file
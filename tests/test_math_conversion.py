@@ -15,11 +15,40 @@
 Test script to verify math expression conversion
 """
 
-import markdown
-from confluence_markdown_converter import ConfluenceMarkdownConverter
+import functools
+
+# markdown and the converter are imported inside the functions so collecting
+# the tests does not load them
+
+def _markdown_extensions() -> list:
+    """Fresh extension instances for one markdown call
+
+    Extensions keep per-instance state, so they are not shared between calls;
+    markdown is only imported once the first test needs it.
+    """
+    from markdown.extensions import fenced_code, nl2br, tables, toc
+    return [
+        tables.TableExtension(),
+        fenced_code.FencedCodeExtension(),
+        toc.TocExtension(),
+        nl2br.Nl2BrExtension(),
+        'mdx_math',
+    ]
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(base_url: str, username: str, api_token: str, space_key: str):
+    """Build a converter once per set of credentials and reuse it"""
+    from confluence_markdown_converter import ConfluenceMarkdownConverter
+    return ConfluenceMarkdownConverter(
+        base_url=base_url,
+        username=username,
+        api_token=api_token,
+        space_key=space_key
+    )
 
 def test_math_conversion():
     """Test how math expressions are being converted"""
+    import markdown
     
     # Test markdown content with math
     test_markdown = """# Math Test
@@ -48,13 +77,7 @@ $$
     # Convert to HTML using markdown library
     html_content = markdown.markdown(
         test_markdown,
-        extensions=[
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br',
-            'mdx_math'
-        ]
+        extensions=_markdown_extensions()
     )
     
     print("Generated HTML:")
@@ -63,12 +86,7 @@ $$
     print()
     
     # Test the conversion
-    converter = ConfluenceMarkdownConverter(
-        base_url="https://test.com",
-        username="test",
-        api_token="test",
-        space_key="test"
-    )
+    converter = _get_converter("https://test.com", "test", "test", "test")
     
     confluence_markup = converter.convert_markdown_to_confluence(test_markdown)
     
@@ -15,9 +15,56 @@
 Test script to debug placeholder conversion
 """
 
-import markdown
+import functools
 import re
-from confluence_markdown_converter import ConfluenceMarkdownConverter, MARKDOWN_EXTENSIONS
+
+# markdown and the converter are imported inside the functions so collecting
+# the tests does not load them
+
+# Patterns compiled once at import instead of on every search
+STRIKE_PLACEHOLDER_RE = re.compile(r'\[STRIKE\].*?\[/STRIKE\]')
+IMAGE_PLACEHOLDER_RE = re.compile(r'\[IMAGE\].*?\[/IMAGE\]')
+IMG_TAG_RE = re.compile(r'<img[^>]+>')
+# Image pattern the converter uses, which is being debugged
+CURRENT_IMG_RE = re.compile(r'<img src="([^"]+)" alt="([^"]*)"(?: title="([^"]*)")?\s*/?>')
+
+# Double-quoted attribute inside a single tag
+ATTRIBUTE_RE = re.compile(r'([\w-]+)="([^"]*)"')
+
+def find_images(html: str) -> list:
+    """(src, alt, title) of the images in html, in any attribute order"""
+    # Each tag is located with substring searches and only its own text is
+    # scanned for attributes, so the whole pass stays linear even on
+    # malformed HTML where regexes with several [^>]* spans backtrack
+    images = []
+    start = html.find('<img')
+    while start != -1:
+        end = html.find('>', start)
+        if end == -1:
+            break
+        attributes = dict(ATTRIBUTE_RE.findall(html, start + 4, end))
+        if attributes.get('src'):
+            images.append((attributes['src'], attributes.get('alt', ''), attributes.get('title', '')))
+        start = html.find('<img', end)
+    return images
+
+@functools.lru_cache(maxsize=32)
+def _md_to_html(markdown_content: str) -> str:
+    """Render markdown with the converter's extensions, once per source text"""
+    import markdown
+    from confluence_markdown_converter import MARKDOWN_EXTENSIONS
+    return markdown.markdown(markdown_content, extensions=MARKDOWN_EXTENSIONS)
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(base_url: str, username: str, api_token: str, space_key: str):
+    """Build a converter once per set of credentials and reuse it"""
+    from confluence_markdown_converter import ConfluenceMarkdownConverter
+    return ConfluenceMarkdownConverter(
+        base_url=base_url,
+        username=username,
+        api_token=api_token,
+        space_key=space_key
+    )
 
 def test_placeholders():
     """Test placeholder conversion for strikethrough and images"""
@@ -46,10 +93,7 @@ More text here.
     print()
     
     # Convert to HTML using markdown library
-    html_content = markdown.markdown(
-        test_markdown,
-        extensions=MARKDOWN_EXTENSIONS
-    )
+    html_content = _md_to_html(test_markdown)
     
     print("Generated HTML:")
     print("=" * 50)
@@ -57,14 +101,11 @@ More text here.
     print()
     
     # Test the conversion
-    converter = ConfluenceMarkdownConverter(
-        base_url="https://test.com",
-        username="test",
-        api_token="test",
-        space_key="test"
-    )
+    converter = _get_converter("https://test.com", "test", "test", "test")
     
-    confluence_markup = converter.convert_markdown_to_confluence(test_markdown)
+    # The HTML above was rendered with the converter's own extensions, so
+    # convert it directly instead of parsing the markdown a second time
+    confluence_markup = converter._html_to_confluence_markup(html_content, test_markdown)
     
     print("Confluence Markup:")
     print("=" * 50)
@@ -72,8 +113,8 @@ More text here.
     print()
     
     # Check for placeholders
-    strikes = re.findall(r'\[STRIKE\].*?\[/STRIKE\]', confluence_markup)
-    images = re.findall(r'\[IMAGE\].*?\[/IMAGE\]', confluence_markup)
+    strikes = STRIKE_PLACEHOLDER_RE.findall(confluence_markup)
+    images = IMAGE_PLACEHOLDER_RE.findall(confluence_markup)
     
     print("Found [STRIKE] placeholders:")
     print("=" * 50)
@@ -102,7 +143,7 @@ More text here.
     # Check image handling
     if '<img' in html_content:
         print("✓ HTML contains <img> tags")
-        img_tags = re.findall(r'<img[^>]+>', html_content)
+        img_tags = IMG_TAG_RE.findall(html_content)
         print(f"  Found {len(img_tags)} image tags:")
         for i, img in enumerate(img_tags, 1):
             print(f"    {i}. {img}")
@@ -125,32 +166,22 @@ More text here.
     print("=" * 50)
     
     # Test the current regex pattern from the converter
-    current_pattern = r'<img src="([^"]+)" alt="([^"]*)"(?: title="([^"]*)")?\s*/?>'
-    print(f"Current regex pattern: {current_pattern}")
+    print(f"Current regex pattern: {CURRENT_IMG_RE.pattern}")
     
     # Test against the actual HTML
-    matches = re.findall(current_pattern, html_content)
+    matches = CURRENT_IMG_RE.findall(html_content)
     print(f"Matches found with current pattern: {len(matches)}")
     for i, match in enumerate(matches, 1):
         print(f"  {i}. src='{match[0]}', alt='{match[1]}', title='{match[2]}'")
     
-    # Test a more flexible pattern that handles attribute order
-    flexible_pattern = r'<img[^>]*src="([^"]+)"[^>]*alt="([^"]*)"[^>]*(?:title="([^"]*)")?[^>]*/?>'
-    print(f"\nFlexible regex pattern: {flexible_pattern}")
+    # Scan the tags instead of using a regex, which handles any attribute
+    # order and takes linear time even on malformed HTML
+    print("\nFlexible scan (any attribute order):")
     
-    flexible_matches = re.findall(flexible_pattern, html_content)
-    print(f"Matches found with flexible pattern: {len(flexible_matches)}")
+    flexible_matches = find_images(html_content)
+    print(f"Images found with flexible scan: {len(flexible_matches)}")
     for i, match in enumerate(flexible_matches, 1):
         print(f"  {i}. src='{match[0]}', alt='{match[1]}', title='{match[2]}'")
-    
-    # Test even more flexible pattern
-    very_flexible_pattern = r'<img[^>]*src="([^"]+)"[^>]*alt="([^"]*)"[^>]*/?>'
-    print(f"\nVery flexible regex pattern: {very_flexible_pattern}")
-    
-    very_flexible_matches = re.findall(very_flexible_pattern, html_content)
-    print(f"Matches found with very flexible pattern: {len(very_flexible_matches)}")
-    for i, match in enumerate(very_flexible_matches, 1):
-        print(f"  {i}. src='{match[0]}', alt='{match[1]}'")
 
 if __name__ == "__main__":
     test_placeholders() 
\ No newline at end of file
@@ -16,8 +16,43 @@ Test different possible Confluence URL variations
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from confluence_config import ConfluenceConfig
 
+# One session for every probe so connections to the host are kept alive and
+# reused instead of repeating the TCP and TLS handshakes for each request;
+# rate limiting and transient gateway errors are retried before a probe is
+# reported as failed, with the last status reported if they persist
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False
+    )
+))
+SESSION.headers.update({
+    'Accept': 'application/json',
+    'Content-Type': 'application/json'
+})
+
+# Bytes of the response body shown in the report
+PREVIEW_BYTES = 100
+
+def _fetch(url: str):
+    """GET a URL, returning its status and the start of its body"""
+    # Only the start of the body is shown, so stream it and read just that
+    # much instead of downloading and decoding all of it
+    with SESSION.get(url, timeout=10, stream=True) as response:
+        preview = response.raw.read(PREVIEW_BYTES, decode_content=True)
+        return response.status_code, preview.decode(response.encoding or 'utf-8', 'replace')
+
 def test_url_variations():
     """Test different possible Confluence URL variations"""
 
@@ -33,37 +68,45 @@ def test_url_variations():
         "https://arganteal.atlassian.net/rest/api",
     ]
 
-    session = requests.Session()
-    session.auth = (config.config['username'], config.config['api_token'])
-    session.headers.update({
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    })
+    # Authenticate the shared session
+    SESSION.auth = (config.config['username'], config.config['api_token'])
 
-    for base_url in base_urls:
-        print(f"\nTesting: {base_url}")
-        print("-" * 50)
+    # Probe every variation at once but report them in order, returning the
+    # first that works without waiting for the remaining requests. Probes
+    # already in flight are not interrupted: the interpreter still joins their
+    # threads at exit, which can take up to the request timeout plus retries.
+    # The content listing is limited to one page since only the status matters
+    executor = ThreadPoolExecutor(max_workers=len(base_urls))
+    try:
+        futures = [
+            executor.submit(_fetch, f"{base_url}/rest/api/content?limit=1")
+            for base_url in base_urls
+        ]
+        for base_url, future in zip(base_urls, futures):
+            print(f"\nTesting: {base_url}")
+            print("-" * 50)
 
-        # Test basic API endpoint
-        try:
-            url = f"{base_url}/rest/api/content"
-            response = session.get(url, timeout=10)
-            print(f"Status: {response.status_code}")
-            if response.status_code == 200:
-                print("✓ SUCCESS! This URL works!")
-                print(f"Response preview: {response.text[:100]}...")
-                return base_url
-            elif response.status_code == 401:
-                print("✗ Authentication failed (401)")
-            elif response.status_code == 403:
-                print("✗ Access forbidden (403)")
-            elif response.status_code == 404:
-                print("✗ Not found (404)")
-            else:
-                print(f"✗ Unexpected status: {response.status_code}")
-                print(f"Response: {response.text[:100]}...")
-        except Exception as e:
-            print(f"✗ Error: {e}")
+            # Test basic API endpoint
+            try:
+                status_code, preview = future.result()
+                print(f"Status: {status_code}")
+                if status_code == 200:
+                    print("✓ SUCCESS! This URL works!")
+                    print(f"Response preview: {preview}...")
+                    return base_url
+                elif status_code == 401:
+                    print("✗ Authentication failed (401)")
+                elif status_code == 403:
+                    print("✗ Access forbidden (403)")
+                elif status_code == 404:
+                    print("✗ Not found (404)")
+                else:
+                    print(f"✗ Unexpected status: {status_code}")
+                    print(f"Response: {preview}...")
+            except Exception as e:
+                print(f"✗ Error: {e}")
+    finally:
+        executor.shutdown(wait=False)
 
     return None
 